@@ -11,19 +11,30 @@ BlueZ D-Bus 기반 BLE GATT 서버
 """
 
 import asyncio
-import json
-import time
+import functools
+import heapq
 import logging
-import subprocess
-from typing import Any, Dict, List
-from core.ble_service.utils import json_bytes as _json_bytes_ext, now_ts as _now_ts_ext, now_ms as _now_ms_ext
+import socket
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from operator import itemgetter
+from time import time_ns as _time_ns
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from core.ble_service.utils import json_bytes as _json_bytes_ext, json_loads as _json_loads_ext, payload_bytes as _payload_bytes_ext
 from core.ble_service.wifi import scan_wifi_networks as _scan_wifi_networks_ext, get_network_status as _get_network_status_ext, wpa_connect_immediate as _wpa_connect_immediate_ext, nm_connect_immediate as _nm_connect_immediate_ext, _nm_is_running as _nm_is_running_ext
-from core.ble_service.equipment import get_equipment_info as _get_equipment_info_ext
+from core.ble_service.equipment import get_equipment_info as _get_equipment_info_ext, get_equipment_info_json as _get_equipment_info_json_ext, _PROBE_POOL as _PROBE_POOL_EXT
 
 from dbus_next.aio import MessageBus
 from dbus_next.service import ServiceInterface, method, dbus_property
 from dbus_next.constants import PropertyAccess
-from dbus_next import Variant, BusType
+from dbus_next import Variant, BusType, Message
+
+# uvloop 사용 가능 시 서버 루프를 libuv 기반 루프로 생성(선택 의존성)
+try:
+    import uvloop  # type: ignore
+    _HAS_UVLOOP = True
+except ImportError:
+    _HAS_UVLOOP = False
 
 
 # ===== 고정 UUID =====
@@ -31,13 +42,38 @@ SERVICE_UUID = "12345678-1234-1234-1234-123456789abc"
 WIFI_REGISTER_CHAR_UUID = "87654321-4321-4321-4321-cba987654321"
 EQUIPMENT_SETTINGS_CHAR_UUID = "87654321-4321-4321-4321-cba987654322"
 
+# 'ble-gatt' 로거(모듈 로드 시 1회 조회, 이벤트마다 getLogger 잠금 생략)
+_LOG = logging.getLogger('ble-gatt')
+
+# 두 특성 공통 플래그(모듈 로드 시 1회 생성해 공유)
+CHAR_FLAGS = ['write', 'notify']
+CHAR_FLAGS_STR = ','.join(CHAR_FLAGS)
+
 # Notify 청크 크기(보수적으로 180~200 권장)
 MAX_CHUNK = 20
+# 협상된 MTU 기반 청크 상한(ATT 속성 값 최대 길이)
+MAX_ATT_VALUE = 512
+# ATT Handle Value Notification 헤더(opcode 1 + handle 2)
+ATT_NOTIFY_HEADER = 3
+# 특성별 Notify 대기열 최대 응답 수(초과 시 가장 오래된 응답 폐기)
+NOTIFY_QUEUE_MAX = 256
+# 파싱 결과를 재사용할 요청 최대 길이(반복 폴링용 짧은 요청만 대상)
+PARSE_CACHE_MAX = 256
+# WriteValue 청크 조합: 마지막 쓰기 후 이 시간(초) 동안 추가 쓰기가 없으면 완료로 간주
+CHUNK_IDLE_TIMEOUT = 1.0
+# 길이 접두 프레임: 4바이트 big-endian 길이 헤더 + 본문. 헤더 최상위 바이트는 0이어야 하며
+# (본문 길이 < 2^24) 이 0x00으로 JSON('{')과 구분. 선언 길이 도달 즉시 처리,
+# 타임아웃은 전송 중단 대비 안전장치
+FRAME_HEADER = 4
+FRAME_TIMEOUT = 5.0
+# wifi_scan 응답에 포함할 최대 AP 수(RSSI 상위)
+WIFI_SCAN_TOP = 15
 
 # BlueZ IFACE
 BLUEZ = 'org.bluez'
 GATT_MANAGER_IFACE = 'org.bluez.GattManager1'
 LE_ADV_MANAGER_IFACE = 'org.bluez.LEAdvertisingManager1'
+DBUS_PROPS_IFACE = 'org.freedesktop.DBus.Properties'
 
 # 기본 GATT 객체 경로
 APP_PATH = '/org/factor/gatt'
@@ -46,153 +82,60 @@ WIFI_CHAR_PATH = SERVICE_PATH + '/char0'
 EQUIP_CHAR_PATH = SERVICE_PATH + '/char1'
 ADV_PATH = '/org/factor/advertisement0'
 
-
-def _json_bytes(obj: Dict[str, Any]) -> bytes:
-    try:
-        return json.dumps(obj, ensure_ascii=False).encode('utf-8', errors='ignore')
-    except Exception:
-        logging.getLogger('ble-gatt').exception("json dumps 실패")
-        return b'{}'
+# 블로킹 작업(스캔/네트워크 조회/Wi-Fi 연결/설비 조회) 전용 공유 스레드풀
+BLE_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix='ble-worker')
 
 
 def _now_ts() -> int:
-    return int(time.time())
+    # float 중간값 없이 정수 연산으로 초 단위 변환
+    return _time_ns() // 1_000_000_000
 
 
-def _scan_wifi_networks() -> List[Dict[str, Any]]:
-    """iwlist를 사용하여 주변 Wi-Fi 네트워크 스캔(ssid, rssi, security)"""
-    networks: List[Dict[str, Any]] = []
-    try:
-        result = subprocess.run(
-            ['sudo', 'iwlist', 'wlan0', 'scan'], capture_output=True, text=True, timeout=15
-        )
-        if result.returncode != 0:
-            return networks
-
-        current: Dict[str, Any] = {}
-        for raw in (result.stdout or '').split('\n'):
-            line = (raw or '').strip()
-            if not line:
-                continue
-            if line.startswith('Cell '):
-                if current.get('ssid'):
-                    networks.append(current)
-                current = {}
-                continue
-            if 'ESSID:' in line:
-                try:
-                    ssid = line.split('ESSID:', 1)[1].strip().strip('"')
-                    current['ssid'] = ssid
-                except Exception:
-                    logging.getLogger('ble-gatt').exception("Notify-chunk 프리뷰 로깅 실패")
-                continue
-            if 'Signal level=' in line:
-                try:
-                    import re as _re
-                    m = _re.search(r'Signal level=\s*(-?\d+)', line)
-                    if m:
-                        current['rssi'] = int(m.group(1))
-                except Exception:
-                    pass
-                continue
-            if 'Encryption key:' in line:
-                enc_on = 'on' in line.lower()
-                current.setdefault('_enc', enc_on)
-                continue
-            if ('WPA2' in line) or ('IEEE 802.11i' in line) or ('RSN' in line):
-                current['security'] = 'WPA2'
-                continue
-            if 'WPA' in line and 'WPA2' not in line:
-                current.setdefault('security', 'WPA')
-                continue
-            if 'WEP' in line:
-                current.setdefault('security', 'WEP')
-                continue
-
-        if current.get('ssid'):
-            networks.append(current)
-
-        for n in networks:
-            if 'security' not in n:
-                if n.get('_enc'):
-                    n['security'] = 'Protected'
-                else:
-                    n['security'] = 'Open'
-            if 'rssi' not in n:
-                n['rssi'] = -100
-            n.pop('_enc', None)
-        return networks
-    except Exception:
-        logging.getLogger('ble-gatt').exception("Wi-Fi 스캔 실패(iwlist)")
-        return networks
+def _now_ms() -> int:
+    return _time_ns() // 1_000_000
 
 
-def _get_network_status() -> Dict[str, Any]:
-    """현재 네트워크 상태 요약(wifi/ethernet) 반환.
-    - wifi: ssid, ip, gateway, connected
-    - ethernet: ip, gateway, connected
-    """
-    status: Dict[str, Any] = {
-        'wifi': {'interface': 'wlan0', 'connected': False, 'ssid': '', 'ip': '', 'gateway': ''},
-        'ethernet': {'interface': 'eth0', 'connected': False, 'ip': '', 'gateway': ''},
-    }
+# 고정 오류 응답 템플릿: timestamp를 제외한 본문을 1회만 직렬화해 두고 끝에 덧붙임
+_WIFI_INVALID_JSON_PREFIX = _json_bytes_ext(
+    {"type": "wifi_scan_result", "data": {"success": False, "error": "invalid_json"}}
+)[:-1]
+_EQUIP_INVALID_JSON_PREFIX = _json_bytes_ext(
+    {"type": "equipment_error", "data": {"ok": False, "error": "invalid_json"}}
+)[:-1]
+# 설비 정보 응답 앞부분('..."data": '까지): 뒤에 설비 정보 JSON 바이트와 timestamp를 붙임
+_EQUIP_INFO_JSON_HEAD = _json_bytes_ext({"type": "get_equipment_info_result", "data": None})[:-len(b'null}')]
 
-    # 1) SSID 확인 (iwgetid)
-    try:
-        r = subprocess.run(['iwgetid', '-r'], capture_output=True, text=True, timeout=3)
-        if r.returncode == 0:
-            ssid = (r.stdout or '').strip()
-            if ssid:
-                status['wifi']['ssid'] = ssid
-                status['wifi']['connected'] = True
-    except Exception:
-        logging.getLogger('ble-gatt').exception("iwgetid 실행 실패")
 
-    # 2) IP 주소 확인 (psutil)
-    try:
-        import psutil  # type: ignore
-        addrs = psutil.net_if_addrs()
-        def _first_ipv4_addr(ifname: str) -> str:
-            for snic in addrs.get(ifname, []) or []:
-                if getattr(snic, 'family', None) == getattr(__import__('socket'), 'AF_INET', None):
-                    return snic.address or ''
-            return ''
-        status['wifi']['ip'] = _first_ipv4_addr('wlan0')
-        status['ethernet']['ip'] = _first_ipv4_addr('eth0')
-        if status['ethernet']['ip']:
-            status['ethernet']['connected'] = True
-    except Exception:
-        logging.getLogger('ble-gatt').exception("IP 주소 조회(psutil) 실패")
+def _stamped_bytes(prefix: bytes, ts: int) -> bytes:
+    """미리 직렬화한 응답 본문(prefix)에 timestamp 필드를 붙여 JSON 바이트 완성"""
+    return b'%s, "timestamp": %d}' % (prefix, ts)
+
+
+def _is_json_object_start(raw: bytes) -> bool:
+    """JSON 객체('{')로 시작하는지 판정(JSON이 허용하는 선행 공백/개행은 건너뜀)"""
+    return raw[:1] == b'{' or raw.lstrip()[:1] == b'{'
 
-    # 3) 기본 게이트웨이 확인 (ip route)
-    try:
-        r = subprocess.run(['ip', 'route', 'show', 'default'], capture_output=True, text=True, timeout=3)
-        line = (r.stdout or '').splitlines()[0] if (r.returncode == 0 and (r.stdout or '').strip()) else ''
-        # 예: "default via 192.168.0.1 dev wlan0 proto dhcp metric 600"
-        if line:
-            parts = line.split()
-            gw = ''
-            dev = ''
-            if 'via' in parts:
-                try:
-                    gw = parts[parts.index('via') + 1]
-                except Exception:
-                    logging.getLogger('ble-gatt').exception("기본 게이트웨이 파싱(via) 실패")
-                    gw = ''
-            if 'dev' in parts:
-                try:
-                    dev = parts[parts.index('dev') + 1]
-                except Exception:
-                    logging.getLogger('ble-gatt').exception("기본 게이트웨이 파싱(dev) 실패")
-                    dev = ''
-            if dev == 'wlan0':
-                status['wifi']['gateway'] = gw
-            elif dev == 'eth0':
-                status['ethernet']['gateway'] = gw
-    except Exception:
-        logging.getLogger('ble-gatt').exception("기본 게이트웨이 조회(ip route) 실패")
 
-    return status
+def _is_json_object_end(raw: bytes) -> bool:
+    """JSON 객체('}')로 끝나는지 판정. 후행 공백/개행(예: 줄바꿈 종료 전송)은 건너뜀"""
+    return raw.endswith(b'}') or raw.rstrip().endswith(b'}')
+
+
+# 지원 요청 타입(정확히 일치하면 소문자 변환 생략)
+_KNOWN_TYPES = frozenset(('wifi_scan', 'get_network_status', 'wifi_register', 'get_equipment_info'))
+
+
+def _msg_format(msg: Dict[str, Any]) -> str:
+    """응답 인코딩 형식: 요청에 "format": "cbor"가 있을 때만 CBOR, 기본 JSON"""
+    return 'cbor' if msg.get('format') == 'cbor' else 'json'
+
+
+def _msg_type(msg: Dict[str, Any]) -> str:
+    """요청 type 추출: 알려진 타입은 그대로, 그 외(대소문자 혼용 등)만 소문자 정규화"""
+    mtype = msg.get('type', '')
+    if isinstance(mtype, str) and mtype in _KNOWN_TYPES:
+        return mtype
+    return str(mtype).lower()
 
 
 class GattService(ServiceInterface):
@@ -222,62 +165,219 @@ class GattCharacteristic(ServiceInterface):
         self.path = path
         self._value: bytes = b''
         self._notifying = False
+        # 서버 이벤트 루프(_async_run에서 export 시 1회 설정, 핸들러에서 재조회하지 않음)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        # 협상된 ATT MTU(0=미확인). WriteValue options의 'mtu'로 갱신
+        self._mtu = 0
+        # 직전 짧은 요청(PARSE_CACHE_MAX 미만)의 (원문, 파싱 결과): 동일 요청 반복 시 json 파싱 생략
+        self._parse_cache: Tuple[bytes, Any] = (b'', None)
+        # AcquireNotify로 BlueZ에 넘긴 SOCK_SEQPACKET 소켓(없으면 PropertiesChanged 사용)
+        self._notify_sock: Optional[socket.socket] = None
+        # BlueZ에 넘길 상대편 소켓: 응답(SCM_RIGHTS) 송신 완료 전 FD 번호 재사용 방지를 위해 보관
+        self._notify_peer: Optional[socket.socket] = None
+        # Notify 대기열/전송 워커(_start_notify_worker에서 생성)
+        self._notify_queue: Optional[asyncio.Queue] = None
+        self._notify_task: Optional[asyncio.Task] = None
+        # Value 변경 시그널 직접 송신용 버스(_start_notify_worker에서 설정)
+        self._bus: Optional[MessageBus] = None
+
+    def _loads_cached(self, raw: bytes) -> Any:
+        """JSON 파싱. 직전과 동일한 짧은 요청이면 이전 파싱 결과를 재사용"""
+        cached_raw, cached_msg = self._parse_cache
+        if raw == cached_raw:
+            return cached_msg
+        msg = _json_loads_ext(raw)
+        if len(raw) < PARSE_CACHE_MAX:
+            self._parse_cache = (raw, msg)
+        return msg
+
+    def _message_complete(self) -> bool:
+        """청크 버퍼가 완성된 메시지인지 판정(타임아웃 없이 즉시 처리 가능 여부).
+
+        - 길이 접두 프레임(4바이트 big-endian 길이 헤더, 최상위 바이트 0): 헤더 뒤 본문이
+          선언 길이만큼 수신되면 완료
+        - JSON 직접 전송: 앞뒤 공백을 제외하고 '{'~'}' 형태이며 파싱에 성공하면 완료
+          (짧은 요청의 파싱 결과는 _loads_cached 캐시에 남아 처리 시 재사용)
+        """
+        buf = self._chunk_buffer
+        if buf[:1] == b'\x00':
+            return (len(buf) >= FRAME_HEADER
+                    and len(buf) - FRAME_HEADER >= int.from_bytes(buf[:FRAME_HEADER], 'big'))
+        if not (_is_json_object_start(buf) and _is_json_object_end(buf)):
+            return False
+        try:
+            self._loads_cached(bytes(buf))
+        except ValueError:
+            # 중간 청크가 '}'로 끝난 경우 등: 다음 쓰기/타임아웃 대기
+            return False
+        return True
 
-    def _notify_value(self, value: bytes):
-        self._value = value
-        # 전체 본문은 전송하지 않고, 청크만 전송/로깅
-        logging.getLogger('ble-gatt').info(
-            "Notify-begin [%s] total_bytes=%d chunk_size=%d",
-            self.uuid, len(value), MAX_CHUNK
-        )
-        if not self._notifying:
+    def _append_chunk(self, value: bytes) -> None:
+        """WriteValue 청크 누적. 완성 시 즉시 처리, 미완성 시 마지막 쓰기 기준 타임아웃 후 처리"""
+        self._chunk_buffer += value
+        if self._chunk_timeout:
+            self._chunk_timeout.cancel()
+            self._chunk_timeout = None
+        if self._message_complete():
+            self._process_complete_message()
+            return
+        # 길이 접두 프레임은 완료 시점을 알 수 있으므로 타임아웃은 안전장치로만 사용
+        timeout = FRAME_TIMEOUT if self._chunk_buffer[:1] == b'\x00' else CHUNK_IDLE_TIMEOUT
+        self._chunk_timeout = self._loop.call_later(timeout, self._process_complete_message)
+
+    def _take_message(self) -> bytes:
+        """조합된 메시지를 bytes로 1회 고정해 반환하고 버퍼는 비워서 재사용(4바이트 길이 헤더 제거)"""
+        raw = bytes(self._chunk_buffer)
+        self._chunk_buffer.clear()
+        if raw[:1] == b'\x00' and len(raw) >= FRAME_HEADER:
+            raw = raw[FRAME_HEADER:FRAME_HEADER + int.from_bytes(raw[:FRAME_HEADER], 'big')]
+        return raw
+
+    def _update_mtu(self, options: Dict[str, Any]) -> None:
+        """WriteValue/ReadValue options의 'mtu'(BlueZ 5.50+)로 협상된 ATT MTU 갱신"""
+        mtu = (options or {}).get('mtu')
+        if mtu is None:
+            return
+        try:
+            self._mtu = int(getattr(mtu, 'value', mtu))
+        except (TypeError, ValueError):
+            pass
+
+    def _chunk_size(self) -> int:
+        """Notify 청크 크기: MTU 확인 시 MTU-3(최대 512), 미확인 시 MAX_CHUNK"""
+        if self._mtu > ATT_NOTIFY_HEADER + MAX_CHUNK:
+            return min(self._mtu - ATT_NOTIFY_HEADER, MAX_ATT_VALUE)
+        return MAX_CHUNK
+
+    def _run_blocking(self, fn: Callable[[], bytes]) -> None:
+        """응답 바이트를 만드는 블로킹 작업 fn을 BLE_POOL에서 실행하고, 완료 시 루프에서 Notify"""
+        loop = self._loop
+        loop.run_in_executor(BLE_POOL, fn).add_done_callback(self._on_blocking_done)
+
+    def _on_blocking_done(self, fut: 'asyncio.Future') -> None:
+        try:
+            payload = fut.result()
+        except Exception:
+            _LOG.exception("BLE 작업 실행 실패 [%s]", self.uuid)
+            return
+        self._notify_value(payload)
+
+    def _start_notify_worker(self, loop: asyncio.AbstractEventLoop, bus: MessageBus) -> None:
+        """서버 루프/버스 연결 및 Notify 전송 워커 시작(_async_run에서 export 시 호출)"""
+        self._loop = loop
+        self._bus = bus
+        self._notify_queue = asyncio.Queue(maxsize=NOTIFY_QUEUE_MAX)
+        self._notify_task = loop.create_task(self._notify_worker())
+
+    def _stop_notify_worker(self) -> None:
+        if self._notify_task is not None:
+            self._notify_task.cancel()
+            self._notify_task = None
+
+    def _enqueue_notify(self, value: bytes) -> None:
+        """Notify 대기열에 추가(가득 차면 가장 오래된 응답 폐기).
+        루프 스레드 밖에서 호출되면 call_soon_threadsafe로 루프에 위임"""
+        try:
+            on_loop = asyncio.get_running_loop() is self._loop
+        except RuntimeError:
+            on_loop = False
+        if not on_loop:
+            self._loop.call_soon_threadsafe(self._enqueue_notify, value)
             return
+        q = self._notify_queue
+        while True:
+            try:
+                q.put_nowait(value)
+                return
+            except asyncio.QueueFull:
+                dropped = q.get_nowait()
+                _LOG.warning(
+                    "Notify 대기열 가득 참 [%s] → 오래된 응답 폐기 bytes=%d", self.uuid, len(dropped)
+                )
 
-        loop = asyncio.get_event_loop()
+    async def _notify_worker(self) -> None:
+        """대기열의 응답을 순서대로 하나씩 청크 전송(응답 간 청크 섞임 방지)"""
+        while True:
+            data = await self._notify_queue.get()
+            try:
+                await self._send_chunks(data, self._chunk_size())
+            except Exception:
+                _LOG.exception("Notify 전송 실패 [%s]", self.uuid)
 
-        async def _send_chunks(data: bytes):
+    async def _send_chunks(self, data: bytes, chunk_size: int) -> None:
+        sock = self._notify_sock
+        # 여러 청크로 나뉘는 응답만 첫 청크 전 지연(한 청크 응답은 즉시 전송)
+        if sock is None and len(data) > chunk_size:
             await asyncio.sleep(0.1)
-            for off in range(0, len(data), MAX_CHUNK):
-                chunk = data[off:off + MAX_CHUNK]
-                # 청크별 로깅 (프리뷰: 텍스트/헥스)
-                try:
-                    preview_text = chunk[:128].decode('utf-8', 'replace')
-                except Exception:
-                    logging.getLogger('ble-gatt').exception("Notify-chunk 프리뷰 로깅 실패")
-                    preview_text = ''
-                preview_hex = chunk[:32].hex()
+        # INFO 비활성 시 청크별 프리뷰(디코드/헥스) 생성 생략
+        log_preview = _LOG.isEnabledFor(logging.INFO)
+        # memoryview 슬라이스: 소켓 경로는 복사 없이 송신, D-Bus 경로만 bytes로 1회 복사
+        view = memoryview(data)
+        for off in range(0, len(data), chunk_size):
+            chunk = view[off:off + chunk_size]
+            # 청크별 로깅 (프리뷰: 텍스트/헥스)
+            if log_preview:
+                _LOG.info(
+                    "Notify-chunk [%s] off=%d len=%d/%d preview=%s hex=%s",
+                    self.uuid, off, len(chunk), len(data),
+                    bytes(chunk[:128]).decode('utf-8', 'replace'), chunk[:32].hex()
+                )
 
+            if sock is not None:
+                # AcquireNotify 소켓: 커널 소켓 버퍼가 흐름 제어하므로 고정 지연 불필요
+                # SEQPACKET은 send 1회=notify 1건이므로 청크를 합쳐 보낼 수 없음.
+                # 버퍼 여유가 있으면 루프 왕복 없이 바로 송신, 가득 찬 경우에만 대기
                 try:
-                    logging.getLogger('ble-gatt').info(
-                        "Notify-chunk [%s] off=%d len=%d/%d preview=%s hex=%s",
-                        self.uuid, off, len(chunk), len(data), preview_text, preview_hex
+                    try:
+                        sock.send(chunk)
+                    except BlockingIOError:
+                        await self._loop.sock_sendall(sock, chunk)
+                    continue
+                except OSError:
+                    _LOG.exception(
+                        "Notify 소켓 전송 실패 [%s] → PropertiesChanged로 대체", self.uuid
                     )
-                except Exception:
-                    logging.getLogger('ble-gatt').exception("Notify-chunk 프리뷰 로깅 실패")
+                    self._release_notify_sock()
+                    sock = None
 
-                try:
-                    self.emit_properties_changed({'Value': bytes(chunk)}, [])
-                except Exception:
-                    logging.getLogger('ble-gatt').exception(
-                        "Notify-chunk error [%s] off=%d len=%d/%d",
-                        self.uuid, off, len(chunk), len(data)
-                    )
-                # 너무 빠른 연속 notify 방지
-                await asyncio.sleep(0.05)
-        try:
-            loop.create_task(_send_chunks(value))
-        except RuntimeError:
-            logging.getLogger('ble-gatt').exception("실행 루프 없음")
-            # 실행 루프가 없을 때 동기식 베스트-에포트
-            for off in range(0, len(value), MAX_CHUNK):
-                chunk = value[off:off + MAX_CHUNK]
-                try:
-                    self.emit_properties_changed({'Value': bytes(chunk)}, [])
-                except Exception:
-                    logging.getLogger('ble-gatt').exception(
-                        "Notify-chunk error(sync) [%s] off=%d len=%d/%d",
-                        self.uuid, off, len(chunk), len(value)
-                    )
+            try:
+                self._emit_value_changed(chunk.tobytes())
+            except Exception:
+                _LOG.exception(
+                    "Notify-chunk error [%s] off=%d len=%d/%d",
+                    self.uuid, off, len(chunk), len(data)
+                )
+            # BlueZ가 notify를 장치별 ATT 큐에 쌓아 순서대로 송신하므로 고정 지연 없이
+            # 루프에만 양보(다른 핸들러가 청크 사이에 실행될 수 있도록)
+            await asyncio.sleep(0)
+
+    def _emit_value_changed(self, chunk: bytes) -> None:
+        """PropertiesChanged(Value) 시그널 직접 송신.
+
+        시그니처(sa{sv}as)가 고정이므로 emit_properties_changed의 속성 목록 순회 없이
+        메시지를 바로 구성. 'ay'는 bytes 그대로 마샬링됨.
+        """
+        self._bus.send(Message.new_signal(
+            self.path, DBUS_PROPS_IFACE, 'PropertiesChanged', 'sa{sv}as',
+            [self.name, {'Value': Variant('ay', chunk)}, []]
+        ))
+
+    def _notify_value(self, value: bytes):
+        self._value = value
+        chunk_size = self._chunk_size()
+        # 전체 본문은 전송하지 않고, 청크만 전송/로깅
+        _LOG.info(
+            "Notify-begin [%s] total_bytes=%d chunk_size=%d",
+            self.uuid, len(value), chunk_size
+        )
+        if not self._notifying:
+            return
+
+        if self._notify_queue is None:
+            _LOG.warning("Notify 워커 미시작 [%s]", self.uuid)
+            return
+        # 모든 응답은 단일 워커를 거쳐 순서대로 전송
+        self._enqueue_notify(value)
 
     @dbus_property(access=PropertyAccess.READ)
     def UUID(self) -> 's':  # type: ignore
@@ -299,39 +399,111 @@ class GattCharacteristic(ServiceInterface):
     def Notifying(self) -> 'b':  # type: ignore
         return self._notifying
 
+    @dbus_property(access=PropertyAccess.READ)
+    def NotifyAcquired(self) -> 'b':  # type: ignore
+        return self._notify_sock is not None
+
+    @method()
+    def AcquireNotify(self, options: 'a{sv}') -> 'hq':  # type: ignore
+        """BlueZ 5.46+: notify 전용 소켓 FD와 MTU 반환(PropertiesChanged 대신 소켓 쓰기로 전송)"""
+        self._update_mtu(options)
+        self._release_notify_sock()
+        ours, theirs = socket.socketpair(socket.AF_UNIX, socket.SOCK_SEQPACKET)
+        ours.setblocking(False)
+        self._notify_sock = ours
+        self._notify_peer = theirs
+        self._notifying = True
+        _LOG.info(
+            "AcquireNotify [%s] path=%s mtu=%d", self.uuid, self.path, self._mtu
+        )
+        # 구독 해제(BlueZ 측 FD 닫힘) 감지
+        self._loop.add_reader(ours.fileno(), self._on_notify_sock_event)
+        # 메서드 응답은 이 핸들러 반환 직후 송신 대기열에 들어가므로 다음 루프 차례에 보낸 시그널의
+        # 송신 완료는 응답(SCM_RIGHTS) 송신 완료를 뜻함 → 그때 우리 쪽 사본을 닫음
+        self._loop.call_soon(self._announce_notify_acquired, theirs)
+        return [theirs.fileno(), self._mtu or (MAX_CHUNK + ATT_NOTIFY_HEADER)]
+
+    def _announce_notify_acquired(self, peer: socket.socket) -> None:
+        """NotifyAcquired=True 변경 시그널 송신, 송신 완료 시 BlueZ에 넘긴 FD의 우리 쪽 사본 닫기"""
+        if self._bus is None or self._notify_peer is not peer:
+            return
+        fut = self._bus.send(Message.new_signal(
+            self.path, DBUS_PROPS_IFACE, 'PropertiesChanged', 'sa{sv}as',
+            [self.name, {'NotifyAcquired': Variant('b', True)}, []]
+        ))
+        fut.add_done_callback(lambda _fut: self._close_notify_peer(peer))
+
+    def _close_notify_peer(self, peer: socket.socket) -> None:
+        if self._notify_peer is peer:
+            self._notify_peer = None
+        peer.close()
+
+    def _on_notify_sock_event(self) -> None:
+        """[loop] notify 소켓 읽기 가능: BlueZ는 데이터를 보내지 않으므로 EOF/오류면 구독 해제로 처리"""
+        sock = self._notify_sock
+        if sock is None:
+            return
+        try:
+            if sock.recv(1):
+                return
+        except BlockingIOError:
+            return
+        except OSError:
+            pass
+        _LOG.info("notify 소켓 종료(구독 해제) [%s] path=%s", self.uuid, self.path)
+        self._release_notify_sock()
+
+    def _release_notify_sock(self) -> None:
+        """AcquireNotify 소켓 해제(클라이언트 구독 해제/전송 실패/재획득 시)"""
+        sock, self._notify_sock = self._notify_sock, None
+        peer, self._notify_peer = self._notify_peer, None
+        if peer is not None:
+            peer.close()
+        if sock is None:
+            return
+        self._notifying = False
+        if self._loop is not None:
+            self._loop.remove_reader(sock.fileno())
+        try:
+            sock.close()
+        except OSError:
+            pass
+
     @method()
     def StartNotify(self):
         self._notifying = True
         try:
-            logging.getLogger('ble-gatt').info(
+            _LOG.info(
                 "StartNotify [%s] path=%s", self.uuid, self.path
             )
         except Exception:
-            logging.getLogger('ble-gatt').exception("StartNotify 로깅 실패")
+            _LOG.exception("StartNotify 로깅 실패")
         # Notifying=True 상태 변경 브로드캐스트
         try:
             self.emit_properties_changed({'Notifying': True}, [])
         except Exception:
-            logging.getLogger('ble-gatt').exception("StartNotify PropertiesChanged 실패")
+            _LOG.exception("StartNotify PropertiesChanged 실패")
 
     @method()
     def StopNotify(self):
         self._notifying = False
         try:
-            logging.getLogger('ble-gatt').info(
+            _LOG.info(
                 "StopNotify  [%s] path=%s", self.uuid, self.path
             )
         except Exception:
-            logging.getLogger('ble-gatt').exception("StopNotify 로깅 실패")
+            _LOG.exception("StopNotify 로깅 실패")
         # Notifying=False 상태 변경 브로드캐스트
         try:
             self.emit_properties_changed({'Notifying': False}, [])
         except Exception:
-            logging.getLogger('ble-gatt').exception("StopNotify PropertiesChanged 실패")
+            _LOG.exception("StopNotify PropertiesChanged 실패")
 
     @method()
     def ReadValue(self, options: 'a{sv}') -> 'ay':  # type: ignore
-        return list(self._value)
+        self._update_mtu(options)
+        # dbus-next는 'ay'를 bytes 그대로 마샬링하므로 list 변환 불필요
+        return self._value
 
     @method()
     def WriteValue(self, value: 'ay', options: 'a{sv}'):  # type: ignore
@@ -346,221 +518,238 @@ class ObjectManager(ServiceInterface):
     def __init__(self, service_uuid: str):
         super().__init__('org.freedesktop.DBus.ObjectManager')
         self.service_uuid = service_uuid
+        # 객체 구성은 생성 이후 변하지 않으므로 응답을 1회만 구성해 재사용
+        self._managed = {
+            # Service properties
+            SERVICE_PATH: {
+                'org.bluez.GattService1': {
+                    'UUID': Variant('s', self.service_uuid),
+                    'Primary': Variant('b', True),
+                    'Includes': Variant('ao', [])
+                }
+            },
+            # Characteristic properties
+            WIFI_CHAR_PATH: {
+                'org.bluez.GattCharacteristic1': {
+                    'UUID': Variant('s', WIFI_REGISTER_CHAR_UUID),
+                    'Service': Variant('o', SERVICE_PATH),
+                    'Flags': Variant('as', CHAR_FLAGS),
+                    'Value': Variant('ay', b''),
+                    'NotifyAcquired': Variant('b', False)
+                }
+            },
+            EQUIP_CHAR_PATH: {
+                'org.bluez.GattCharacteristic1': {
+                    'UUID': Variant('s', EQUIPMENT_SETTINGS_CHAR_UUID),
+                    'Service': Variant('o', SERVICE_PATH),
+                    'Flags': Variant('as', CHAR_FLAGS),
+                    'Value': Variant('ay', b''),
+                    'NotifyAcquired': Variant('b', False)
+                }
+            },
+        }
 
     @method()
     def GetManagedObjects(self) -> 'a{oa{sa{sv}}}':  # type: ignore
-        managed = {}
-        # Service properties
-        managed[SERVICE_PATH] = {
-            'org.bluez.GattService1': {
-                'UUID': Variant('s', self.service_uuid),
-                'Primary': Variant('b', True),
-                'Includes': Variant('ao', [])
-            }
-        }
-        # Characteristic properties
-        managed[WIFI_CHAR_PATH] = {
-            'org.bluez.GattCharacteristic1': {
-                'UUID': Variant('s', WIFI_REGISTER_CHAR_UUID),
-                'Service': Variant('o', SERVICE_PATH),
-                'Flags': Variant('as', ['write', 'notify']),
-                'Value': Variant('ay', [])
-            }
-        }
-        managed[EQUIP_CHAR_PATH] = {
-            'org.bluez.GattCharacteristic1': {
-                'UUID': Variant('s', EQUIPMENT_SETTINGS_CHAR_UUID),
-                'Service': Variant('o', SERVICE_PATH),
-                'Flags': Variant('as', ['write', 'notify']),
-                'Value': Variant('ay', [])
-            }
-        }
-        return managed
+        return self._managed
 
 class WifiRegisterChar(GattCharacteristic):
     def __init__(self):
-        super().__init__(WIFI_REGISTER_CHAR_UUID, ['write', 'notify'], WIFI_CHAR_PATH)
+        super().__init__(WIFI_REGISTER_CHAR_UUID, CHAR_FLAGS, WIFI_CHAR_PATH)
         # 청크 조합을 위한 버퍼 추가
-        self._chunk_buffer = b''
+        self._chunk_buffer = bytearray()
         self._chunk_timeout = None
 
     @method()
     def WriteValue(self, value: 'ay', options: 'a{sv}'):
-        raw = bytes(value)
+        self._update_mtu(options)
         
-        # 청크 버퍼에 추가
-        self._chunk_buffer += raw
-        
-        # 청크 타임아웃 리셋 (1초 후 청크 조합 완료로 간주)
-        if self._chunk_timeout:
-            self._chunk_timeout.cancel()
-        
-        loop = asyncio.get_event_loop()
-        self._chunk_timeout = loop.call_later(1.0, self._process_complete_message)
-        
-        # 현재 청크 로깅
-        try:
-            preview = raw[:256].decode('utf-8', 'replace')
-            logging.getLogger('ble-gatt').info(
-                "Write chunk [%s] bytes=%d total=%d preview=%s", 
-                self.uuid, len(raw), len(self._chunk_buffer), preview
-            )
-        except Exception:
-            logging.getLogger('ble-gatt').info(
-                "Write chunk [%s] bytes=%d total=%d (non-utf8)", 
-                self.uuid, len(raw), len(self._chunk_buffer)
+        # 현재 청크 로깅(INFO 비활성 시 프리뷰 디코드 생략)
+        if _LOG.isEnabledFor(logging.INFO):
+            _LOG.info(
+                "Write chunk [%s] bytes=%d total=%d preview=%s",
+                self.uuid, len(value), len(self._chunk_buffer) + len(value),
+                bytes(value[:256]).decode('utf-8', 'replace')
             )
+        # 청크 버퍼에 추가 후 조합 완료 시 즉시 처리, 아니면 타임아웃 대기
+        self._append_chunk(value)
 
     def _process_complete_message(self):
         """청크 조합 완료 후 전체 메시지 처리"""
         if not self._chunk_buffer:
             return
-            
+        raw = self._take_message()
+
+        # JSON 객체('{', 선행 공백 허용)로 시작하지 않으면 파싱 없이 즉시 invalid_json 응답
+        if not _is_json_object_start(raw):
+            _LOG.warning(
+                "Write complete [%s] JSON 객체 아님 total_bytes=%d", self.uuid, len(raw)
+            )
+            self._notify_value(_stamped_bytes(_WIFI_INVALID_JSON_PREFIX, _now_ts()))
+            return
+
         try:
             # 전체 메시지 로깅
-            preview = self._chunk_buffer[:256].decode('utf-8', 'replace')
-            logging.getLogger('ble-gatt').info(
-                "Write complete [%s] total_bytes=%d preview=%s", 
-                self.uuid, len(self._chunk_buffer), preview
-            )
+            if _LOG.isEnabledFor(logging.INFO):
+                _LOG.info(
+                    "Write complete [%s] total_bytes=%d preview=%s",
+                    self.uuid, len(raw), raw[:256].decode('utf-8', 'replace')
+                )
             
-            msg = json.loads(self._chunk_buffer.decode('utf-8', 'ignore'))
-            mtype = str(msg.get('type', '')).lower()
+            msg = self._loads_cached(raw)
+            mtype = _msg_type(msg)
         except Exception:
-            logging.getLogger('ble-gatt').exception("청크 조합 메시지 처리 실패")
-            rsp = {"type": "wifi_scan_result", "data": {"success": False, "error": "invalid_json"}, "timestamp": _now_ts()}
-            self._notify_value(_json_bytes(rsp))
-            self._chunk_buffer = b''
+            _LOG.exception("청크 조합 메시지 처리 실패")
+            self._notify_value(_stamped_bytes(_WIFI_INVALID_JSON_PREFIX, _now_ts()))
             return
         
         # 라즈베리파이에서 네트워크 스캔 결과 반환
         if mtype == 'wifi_scan':
-            nets = _scan_wifi_networks_ext()
-            # RSSI 내림차순 정렬 후 상위 15개만 반환
-            try:
-                nets_sorted = sorted(nets, key=lambda n: n.get('rssi', -100), reverse=True)
-                nets_top = nets_sorted[:15]
-            except Exception:
-                logging.getLogger('ble-gatt').exception("Wi-Fi 스캔 결과 정렬 실패")
-                nets_top = nets[:15]
-            rsp = {"type": "wifi_scan_result", "data": nets_top, "timestamp": _now_ts()}
-            self._notify_value(_json_bytes(rsp))
+            # rescan=true 요청 시에만 캐시 무시하고 재스캔
+            # 스캔(최대 15초)은 스레드에서 실행하여 dbus 루프를 막지 않음
+            self._run_blocking(functools.partial(
+                self._wifi_scan_reply, bool(msg.get('rescan', False)), _msg_format(msg)))
         
         # 네트워크 상태 조회
         elif mtype == 'get_network_status':
-            status = _get_network_status_ext()
-            rsp = {"type": "get_network_status_result", "data": status, "timestamp": _now_ts_ext()}
-            payload = _json_bytes(rsp)
-            # 청크 전송으로 변경
-            self._notify_value(payload)
+            self._run_blocking(functools.partial(self._network_status_reply, _msg_format(msg)))
         
-        # 네트워크 연결
+        # 네트워크 연결(nmcli/wpa_cli + 최대 25초 연결 대기)
         elif mtype == 'wifi_register':
-            payload_in = msg.get('data') or {}
-            # NetworkManager 활성 시 nmcli 우선, 아니면 wpa_cli 사용
-            try:
-                use_nm = _nm_is_running_ext()
-            except Exception:
-                use_nm = False
-            res = _nm_connect_immediate_ext(payload_in) if use_nm else _wpa_connect_immediate_ext(payload_in, persist=False)
-
-            
-            rsp = {
-                "ver": int(msg.get('ver', 1)),
-                "id": msg.get('id') or "",
-                "type": "wifi_register_result",
-                "ts": _now_ms_ext(),
-                "data": {
-                    "ok": bool(res.get('ok')),
-                    "message": res.get('message', ''),
-                    "ssid": res.get('ssid', str(payload_in.get('ssid', '')))
-                }
-            }
-            self._notify_value(_json_bytes_ext(rsp))
+            self._run_blocking(functools.partial(self._wifi_register_reply, msg))
         
 
         else:
             rsp = {"type": "wifi_error", "data": {"success": False, "error": "unknown_type", "type": mtype}, "timestamp": _now_ts()}
-            self._notify_value(_json_bytes(rsp))
+            self._notify_value(_payload_bytes_ext(rsp, _msg_format(msg)))
         
-        # 처리 완료 후 버퍼 클리어
-        self._chunk_buffer = b''
+
+    @staticmethod
+    def _wifi_scan_reply(force: bool, fmt: str) -> bytes:
+        """[BLE_POOL] Wi-Fi 스캔 후 RSSI 상위 결과 응답 생성(스캔 실패 시 빈 목록)"""
+        try:
+            nets = _scan_wifi_networks_ext(force=force)
+        except Exception:
+            _LOG.exception("Wi-Fi 스캔 실행 실패")
+            nets = []
+        # RSSI 상위 WIFI_SCAN_TOP개만 반환(전체 정렬 없이 부분 선택, 스캐너가 rssi 키 보장)
+        try:
+            nets_top = heapq.nlargest(WIFI_SCAN_TOP, nets, key=itemgetter('rssi'))
+        except Exception:
+            _LOG.exception("Wi-Fi 스캔 결과 정렬 실패")
+            nets_top = nets[:WIFI_SCAN_TOP]
+        rsp = {"type": "wifi_scan_result", "data": nets_top, "timestamp": _now_ts()}
+        return _payload_bytes_ext(rsp, fmt)
+
+    @staticmethod
+    def _network_status_reply(fmt: str) -> bytes:
+        """[BLE_POOL] 네트워크 상태 조회 응답 생성"""
+        status = _get_network_status_ext()
+        rsp = {"type": "get_network_status_result", "data": status, "timestamp": _now_ts()}
+        return _payload_bytes_ext(rsp, fmt)
+
+    @staticmethod
+    def _wifi_register_reply(msg: Dict[str, Any]) -> bytes:
+        """[BLE_POOL] Wi-Fi 연결 시도 후 결과 응답 생성"""
+        payload_in = msg.get('data') or {}
+        # NetworkManager 활성 시 nmcli 우선, 아니면 wpa_cli 사용
+        try:
+            use_nm = _nm_is_running_ext()
+        except Exception:
+            use_nm = False
+        res = _nm_connect_immediate_ext(payload_in) if use_nm else _wpa_connect_immediate_ext(payload_in, persist=False)
+
+        rsp = {
+            "ver": int(msg.get('ver', 1)),
+            "id": msg.get('id') or "",
+            "type": "wifi_register_result",
+            "ts": _now_ms(),
+            "data": {
+                "ok": bool(res.get('ok')),
+                "message": res.get('message', ''),
+                "ssid": res.get('ssid', str(payload_in.get('ssid', '')))
+            }
+        }
+        return _payload_bytes_ext(rsp, _msg_format(msg))
 
 
 class EquipmentSettingsChar(GattCharacteristic):
     def __init__(self):
-        super().__init__(EQUIPMENT_SETTINGS_CHAR_UUID, ['write', 'notify'], EQUIP_CHAR_PATH)
+        super().__init__(EQUIPMENT_SETTINGS_CHAR_UUID, CHAR_FLAGS, EQUIP_CHAR_PATH)
         self._settings: Dict[str, Any] = {}
         # 청크 조합을 위한 버퍼 추가
-        self._chunk_buffer = b''
+        self._chunk_buffer = bytearray()
         self._chunk_timeout = None
 
     @method()
     def WriteValue(self, value: 'ay', options: 'a{sv}'):
-        raw = bytes(value)
-        
-        # 청크 버퍼에 추가
-        self._chunk_buffer += raw
+        self._update_mtu(options)
         
-        # 청크 타임아웃 리셋 (1초 후 청크 조합 완료로 간주)
-        if self._chunk_timeout:
-            self._chunk_timeout.cancel()
-        
-        loop = asyncio.get_event_loop()
-        self._chunk_timeout = loop.call_later(1.0, self._process_complete_message)
-        
-        # 현재 청크 로깅
-        try:
-            preview = raw[:256].decode('utf-8', 'replace')
-            logging.getLogger('ble-gatt').info(
-                "Write chunk [%s] bytes=%d total=%d preview=%s", 
-                self.uuid, len(raw), len(self._chunk_buffer), preview
-            )
-        except Exception:
-            logging.getLogger('ble-gatt').info(
-                "Write chunk [%s] bytes=%d total=%d (non-utf8)", 
-                self.uuid, len(raw), len(self._chunk_buffer)
+        # 현재 청크 로깅(INFO 비활성 시 프리뷰 디코드 생략)
+        if _LOG.isEnabledFor(logging.INFO):
+            _LOG.info(
+                "Write chunk [%s] bytes=%d total=%d preview=%s",
+                self.uuid, len(value), len(self._chunk_buffer) + len(value),
+                bytes(value[:256]).decode('utf-8', 'replace')
             )
+        # 청크 버퍼에 추가 후 조합 완료 시 즉시 처리, 아니면 타임아웃 대기
+        self._append_chunk(value)
 
     def _process_complete_message(self):
         """청크 조합 완료 후 전체 메시지 처리"""
         if not self._chunk_buffer:
             return
-            
+        raw = self._take_message()
+
+        # JSON 객체('{', 선행 공백 허용)로 시작하지 않으면 파싱 없이 즉시 invalid_json 응답
+        if not _is_json_object_start(raw):
+            _LOG.warning(
+                "Write complete [%s] JSON 객체 아님 total_bytes=%d", self.uuid, len(raw)
+            )
+            self._notify_value(_stamped_bytes(_EQUIP_INVALID_JSON_PREFIX, _now_ts()))
+            return
+
         try:
             # 전체 메시지 로깅
-            preview = self._chunk_buffer[:256].decode('utf-8', 'replace')
-            logging.getLogger('ble-gatt').info(
-                "Write complete [%s] total_bytes=%d preview=%s", 
-                self.uuid, len(self._chunk_buffer), preview
-            )
-            
-            # JSON 파싱 전에 버퍼 클리어 (중복 방지)
-            buffer_copy = self._chunk_buffer
-            self._chunk_buffer = b''
+            if _LOG.isEnabledFor(logging.INFO):
+                _LOG.info(
+                    "Write complete [%s] total_bytes=%d preview=%s",
+                    self.uuid, len(raw), raw[:256].decode('utf-8', 'replace')
+                )
             
-            msg = json.loads(buffer_copy.decode('utf-8', 'ignore'))
-            mtype = str(msg.get('type', '')).lower()
+            msg = self._loads_cached(raw)
+            mtype = _msg_type(msg)
+            fmt = _msg_format(msg)
             
             if mtype == 'get_equipment_info':
-                # 설비 정보 조회
-                equipment_data = _get_equipment_info_ext()
-                rsp = {
-                    "type": "get_equipment_info_result",
-                    "data": equipment_data,
-                    "timestamp": _now_ts_ext()
-                }
+                # 설비 정보 조회(시리얼 M115/v4l2-ctl 등 블로킹) → 스레드풀에서 실행
+                self._run_blocking(functools.partial(self._equipment_info_reply, fmt))
+                return
             else:
-                rsp = {"type": "equipment_error", "data": {"ok": False, "error": "unknown_type", "type": mtype}, "timestamp": _now_ts_ext()}
+                rsp = {"type": "equipment_error", "data": {"ok": False, "error": "unknown_type", "type": mtype}, "timestamp": _now_ts()}
                 
         except Exception:
-            logging.getLogger('ble-gatt').exception("청크 조합 메시지 처리 실패")
-            rsp = {"type": "equipment_error", "data": {"ok": False, "error": "invalid_json"}, "timestamp": _now_ts_ext()}
-            self._chunk_buffer = b''
+            _LOG.exception("청크 조합 메시지 처리 실패")
+            self._notify_value(_stamped_bytes(_EQUIP_INVALID_JSON_PREFIX, _now_ts()))
             return
         
         # 응답 전송
-        self._notify_value(_json_bytes_ext(rsp))
+        self._notify_value(_payload_bytes_ext(rsp, fmt))
+
+    @staticmethod
+    def _equipment_info_reply(fmt: str) -> bytes:
+        """[BLE_POOL] 설비 정보 조회 응답 생성(항목별 캐시는 equipment 모듈에서 관리).
+
+        JSON 응답은 캐시 세대별로 직렬화된 설비 정보 바이트를 그대로 이어 붙임
+        """
+        if fmt == 'json':
+            return _stamped_bytes(_EQUIP_INFO_JSON_HEAD + _get_equipment_info_json_ext(), _now_ts())
+        rsp = {
+            "type": "get_equipment_info_result",
+            "data": _get_equipment_info_ext(),
+            "timestamp": _now_ts()
+        }
+        return _payload_bytes_ext(rsp, fmt)
 
 
 class NoIOAgent(ServiceInterface):
@@ -630,13 +819,14 @@ class LEAdvertisement(ServiceInterface):
         pass
 
 
-async def _async_run(logger: logging.Logger):
-    bus = await MessageBus(bus_type=BusType.SYSTEM).connect()
+async def _async_run(logger: logging.Logger, stop: asyncio.Event):
+    # AcquireNotify 응답으로 FD를 넘기기 위해 unix fd 전달 협상
+    bus = await MessageBus(bus_type=BusType.SYSTEM, negotiate_unix_fd=True).connect()
     # D-Bus 서비스 이름 요청 제거 - 보안 정책 문제 해결
     # try:
     #     await bus.request_name('org.bluez.factor')
     # except Exception:
-    #     logging.getLogger('ble-gatt').exception("DBus 이름 요청 실패(org.bluez.factor)")
+    #     _LOG.exception("DBus 이름 요청 실패(org.bluez.factor)")
 
     adapter_path = '/org/bluez/hci0'
     obj = await bus.introspect(BLUEZ, adapter_path)
@@ -647,7 +837,7 @@ async def _async_run(logger: logging.Logger):
     try:
         adv_mgr = adapter.get_interface(LE_ADV_MANAGER_IFACE)
     except Exception:
-        logging.getLogger('ble-gatt').exception("LEAdvertisingManager1 인터페이스 획득 실패")
+        _LOG.exception("LEAdvertisingManager1 인터페이스 획득 실패")
         adv_mgr = None
 
     # PropertiesChanged 브로드캐스트용 인터페이스
@@ -657,14 +847,21 @@ async def _async_run(logger: logging.Logger):
         await props_iface.call_set('org.bluez.Adapter1', 'Powered', Variant('b', True))
         logger.info('Adapter Powered=on')
     except Exception:
-        logging.getLogger('ble-gatt').exception("Adapter 전원 On 실패")
+        _LOG.exception("Adapter 전원 On 실패")
+    # LE 연결 간격은 root 권한이 필요하므로 install.sh의 /etc/bluetooth/main.conf [LE]에서 설정
 
     # ObjectManager + 서비스/특성 export
+    # await 없이 연속 export → InterfacesAdded 시그널이 한 번에 송신 큐에 쌓여 함께 flush됨
     obj_manager = ObjectManager(SERVICE_UUID)
-    bus.export(APP_PATH, obj_manager)
     svc = GattService(SERVICE_UUID)
     wifi_char = WifiRegisterChar()
     equip_char = EquipmentSettingsChar()
+    loop = asyncio.get_running_loop()
+    wifi_char._start_notify_worker(loop, bus)
+    equip_char._start_notify_worker(loop, bus)
+    for path, iface in ((APP_PATH, obj_manager), (SERVICE_PATH, svc),
+                        (WIFI_CHAR_PATH, wifi_char), (EQUIP_CHAR_PATH, equip_char)):
+        bus.export(path, iface)
 
     # Agent 등록 (자동 수락)
     try:
@@ -680,7 +877,7 @@ async def _async_run(logger: logging.Logger):
         await agent_mgr.call_request_default_agent(agent_path)
         logger.info("BLE Agent 등록 완료 (capability=DisplayYesNo, path=%s)", agent_path)
     except Exception:
-        logging.getLogger('ble-gatt').exception("BLE Agent 등록 실패")
+        _LOG.exception("BLE Agent 등록 실패")
 
     # 구성 로그: 서비스/특성/플래그
     try:
@@ -688,17 +885,13 @@ async def _async_run(logger: logging.Logger):
             "BLE GATT 구성 - service=%s, chars=[{%s:%s}, {%s:%s}]",
             SERVICE_UUID,
             WIFI_REGISTER_CHAR_UUID,
-            ','.join(['write', 'notify']),
+            CHAR_FLAGS_STR,
             EQUIPMENT_SETTINGS_CHAR_UUID,
-            ','.join(['write', 'notify'])
+            CHAR_FLAGS_STR
         )
     except Exception:
         pass
 
-    bus.export(SERVICE_PATH, svc)
-    bus.export(WIFI_CHAR_PATH, wifi_char)
-    bus.export(EQUIP_CHAR_PATH, equip_char)
-
     # GATT 등록
     await gatt_mgr.call_register_application(APP_PATH, {})
     try:
@@ -708,7 +901,7 @@ async def _async_run(logger: logging.Logger):
             SERVICE_PATH
         )
     except Exception:
-        logging.getLogger('ble-gatt').exception("BLE GATT Application 등록 완료 로그 실패")
+        _LOG.exception("BLE GATT Application 등록 완료 로그 실패")
 
     # 광고 등록: 실패 시 원인 진단에 도움이 되도록 경고 강화
     if adv_mgr:
@@ -723,74 +916,115 @@ async def _async_run(logger: logging.Logger):
                     SERVICE_UUID
                 )
             except Exception:
-                logging.getLogger('ble-gatt').exception("BLE 광고 등록 완료 로그 실패")
+                _LOG.exception("BLE 광고 등록 완료 로그 실패")
         except Exception:
-            logging.getLogger('ble-gatt').exception(
+            _LOG.exception(
                 "BLE 광고 등록 실패: 중복 광고 서비스(ble-headless 등) 또는 권한/experimental(-E) 확인 필요"
             )
 
-    # keep alive
+    # 종료 요청(stop_ble_gatt_server)까지 대기
     try:
-        while True:
-            await asyncio.sleep(60)
+        await stop.wait()
     finally:
         # 정리 루틴: 광고/앱 등록 해제(가능한 경우)
         try:
             if adv_mgr:
                 await adv_mgr.call_unregister_advertisement(ADV_PATH)
         except Exception:
-            logging.getLogger('ble-gatt').exception("광고 해제 실패")
+            _LOG.exception("광고 해제 실패")
         try:
             await gatt_mgr.call_unregister_application(APP_PATH)
         except Exception:
-            logging.getLogger('ble-gatt').exception("GATT 앱 해제 실패")
+            _LOG.exception("GATT 앱 해제 실패")
+        wifi_char._stop_notify_worker()
+        equip_char._stop_notify_worker()
+        bus.disconnect()
 
 
-def start_ble_gatt_server(logger: logging.Logger) -> None:
-    """비동기 BLE GATT 서버를 백그라운드에서 실행"""
-    import threading
-    import atexit
-    import functools
+async def run_ble_gatt_server(logger: logging.Logger, stop: Optional[asyncio.Event] = None) -> None:
+    """호출자 루프에서 GATT 서버 실행(stop 설정 또는 태스크 취소 시 등록 해제 후 반환).
+
+    이미 asyncio 루프를 운영하는 호출자는 전용 스레드 없이 다른 코루틴과 함께 gather 가능.
+    start_ble_gatt_server(전용 스레드)는 호출자에게 실행 중인 루프가 없을 때만 사용
+    """
+    await _async_run(logger, stop if stop is not None else asyncio.Event())
 
-    def runner():
-        try:
-            asyncio.run(_async_run(logger))
-        except Exception:
-            logger.exception("BLE GATT 서버 실행 오류")
 
-    t = threading.Thread(target=runner, daemon=True)
-    t.start()
+class BleLoopThread(threading.Thread):
+    """BLE GATT 서버 전용 이벤트 루프 스레드.
 
-    # 베스트-에포트 종료 훅: 별도 버스로 정리 시도
-    async def _cleanup():
+    - 서버 코루틴(_async_run)을 자체 루프에서 실행
+    - submit(): 다른 스레드에서 이 루프로 코루틴 예약(추가 BLE 작업용)
+    - stop(): 종료 이벤트 설정 → _async_run의 정리 루틴(등록 해제) 실행 후 스레드 종료
+    """
+
+    def __init__(self, logger: logging.Logger):
+        # atexit(stop_ble_gatt_server)에서 join하므로 daemon 유지:
+        # non-daemon 스레드는 atexit 이전에 join되어 종료가 멈출 수 있음
+        super().__init__(name='ble-gatt', daemon=True)
+        self.logger = logger
+        self.loop = uvloop.new_event_loop() if _HAS_UVLOOP else asyncio.new_event_loop()
+        self._stop_event: Optional[asyncio.Event] = None
+        # 루프 시작(_stop_event 생성) 전에 들어온 종료 요청도 놓치지 않도록 스레드 간 플래그로 보관
+        self._stop_requested = threading.Event()
+
+    def run(self) -> None:
+        asyncio.set_event_loop(self.loop)
+        # Event는 루프 설정 후 생성(3.9 이하에서 현재 루프에 바인딩됨)
+        self._stop_event = asyncio.Event()
+        if self._stop_requested.is_set():
+            self._stop_event.set()
         try:
-            bus = await MessageBus(bus_type=BusType.SYSTEM).connect()
-            adapter_path = '/org/bluez/hci0'
-            obj = await bus.introspect(BLUEZ, adapter_path)
-            adapter = bus.get_proxy_object(BLUEZ, adapter_path, obj)
-            gatt_mgr = adapter.get_interface(GATT_MANAGER_IFACE)
-            try:
-                await gatt_mgr.call_unregister_application(APP_PATH)
-            except Exception as e:
-                # "Does Not Exist" 에러는 정상적인 상황 (이미 해제됨)
-                if "Does Not Exist" not in str(e):
-                    logging.getLogger('ble-gatt').warning(f"GATT 앱 해제 호출 실패: {e}")
-            try:
-                adv_mgr = adapter.get_interface(LE_ADV_MANAGER_IFACE)
-                await adv_mgr.call_unregister_advertisement(ADV_PATH)
-            except Exception as e:
-                # "Does Not Exist" 에러는 정상적인 상황 (이미 해제됨)
-                if "Does Not Exist" not in str(e):
-                    logging.getLogger('ble-gatt').warning(f"광고 해제 호출 실패: {e}")
+            self.loop.run_until_complete(_async_run(self.logger, self._stop_event))
         except Exception:
-            logging.getLogger('ble-gatt').exception("정리 루틴(bus 연결/조회) 실패")
+            self.logger.exception("BLE GATT 서버 실행 오류")
+        finally:
+            try:
+                self.loop.run_until_complete(self.loop.shutdown_asyncgens())
+            finally:
+                self.loop.close()
+
+    def submit(self, coro) -> Future:
+        """다른 스레드에서 서버 루프로 코루틴 예약"""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def _set_stop(self) -> None:
+        if self._stop_event is not None:
+            self._stop_event.set()
 
-    def _atexit():
+    def stop(self, timeout: float = 5.0) -> None:
+        """종료 요청 후 정리 완료까지 대기(여러 번 호출해도 안전)"""
+        self._stop_requested.set()
         try:
-            asyncio.run(_cleanup())
-        except Exception:
-            logging.getLogger('ble-gatt').exception("종료 훅(_atexit) 실패")
+            self.loop.call_soon_threadsafe(self._set_stop)
+        except RuntimeError:
+            # 루프가 이미 종료됨
+            return
+        if self.is_alive() and threading.current_thread() is not self:
+            self.join(timeout=timeout)
+
+
+# 실행 중인 서버 스레드(stop_ble_gatt_server에서 사용)
+_ble_thread: Optional[BleLoopThread] = None
+
+
+def start_ble_gatt_server(logger: logging.Logger) -> None:
+    """비동기 BLE GATT 서버를 전용 루프 스레드에서 실행(실행 중인 루프가 있으면 run_ble_gatt_server 사용)"""
+    import atexit
+    global _ble_thread
+
+    _ble_thread = BleLoopThread(logger)
+    _ble_thread.start()
 
-    atexit.register(_atexit)
+    # 종료 훅: 서버 루프에 종료를 알려 _async_run의 정리 루틴(등록 해제)이 실행되도록 함
+    atexit.register(stop_ble_gatt_server)
 
 
+def stop_ble_gatt_server(timeout: float = 5.0) -> None:
+    """실행 중인 GATT 서버에 종료를 요청하고 정리 완료까지 대기(여러 번 호출해도 안전)"""
+    if _ble_thread is not None:
+        _ble_thread.stop(timeout=timeout)
+    # 풀 작업자는 non-daemon이므로 대기 중인 스캔/연결/설비 조회를 취소해 종료가 그 뒤에 밀리지 않도록 함
+    # (실행 중인 작업은 각자의 timeout 안에 끝남)
+    BLE_POOL.shutdown(wait=False, cancel_futures=True)
+    _PROBE_POOL_EXT.shutdown(wait=False, cancel_futures=True)
@@ -3,14 +3,24 @@
 프린터, 카메라, 소프트웨어 정보를 수집하여 반환
 """
 
+import errno
+import fcntl
 import json
+import platform
+import re
+import select
+import struct
+import sys
 import time
-import subprocess
+import threading
 import logging
-from typing import Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Callable, Dict, Any, Iterator, List, Optional, Tuple
 from datetime import datetime
 import os
-import psutil
+
+from .utils import json_bytes
 
 # 프린터 통신 모듈 import
 try:
@@ -22,16 +32,163 @@ except ImportError:
     _HAS_PRINTER_MODULES = False
 
 
+# M115 응답 읽기: poll 1회 대기(초) / 'ok'까지 전체 대기 상한(초)
+M115_LINE_TIMEOUT = 0.05
+M115_DEADLINE = 1.0
+# 마지막 M115 결과 캐시(런타임 데이터이므로 설정 파일과 분리, USB 장치 고유 식별자별 저장) / 재사용 기간(초)
+# 캐시 적중 시에도 단일 라인 응답 명령으로 프린터 응답을 확인한 뒤에만 사용
+M115_CACHE_PATH = '/var/lib/factor-client/m115_cache.json'
+M115_CACHE_TTL = 3600.0
+_PRINTER_ALIVE_CMD = b"M105\n"
+# M115 응답 종료 라인('ok' 로 시작하는 줄) 탐지
+_M115_OK_RE = re.compile(rb'(?:^|\n)ok[^\n]*\n')
+
+# FIRMWARE_NAME 기반 모델명 추정(긴 이름 우선 교대식 1회 검색) 및 매칭 문자열별 모델명
+_FW_MODEL_RE = re.compile(r'Ender-3 V3 SE|Ender-3 V2 Neo|Ender-3|Ender-5|Prusa|Ultimaker')
+_FW_MODEL_NAMES = {
+    "Ender-3 V3 SE": "Creality Ender-3 V3 SE",
+    "Ender-3 V2 Neo": "Creality Ender-3 V2 Neo",
+    "Ender-3": "Creality Ender-3",
+    "Ender-5": "Creality Ender-5",
+    "Prusa": "Prusa i3",
+    "Ultimaker": "Ultimaker",
+}
+
+# M115 응답의 펌웨어 계열 탐지(첫 번째로 나타나는 계열) 및 계열별 기본 모델명
+_FW_FAMILY_RE = re.compile(r'Klipper|RepRapFirmware|Marlin')
+_FW_FAMILY_MODELS = {
+    "Klipper": "Klipper-based Printer",
+    "RepRapFirmware": "RepRap-based Printer",
+    "Marlin": "RepRap-based Printer",
+}
+
+# V4L2 ioctl(linux/videodev2.h): 캡처 포맷/프레임 크기/프레임 간격 열거
+_VIDIOC_ENUM_FMT = 0xC0405602
+_VIDIOC_ENUM_FRAMESIZES = 0xC02C564A
+_VIDIOC_ENUM_FRAMEINTERVALS = 0xC034564B
+# struct v4l2_fmtdesc / v4l2_frmsizeenum / v4l2_frmivalenum
+_V4L2_FMTDESC = struct.Struct('III32sII3I')
+_V4L2_FRMSIZEENUM = struct.Struct('III6I2I')
+_V4L2_FRMIVALENUM = struct.Struct('IIIII6I2I')
+_V4L2_BUF_TYPE_VIDEO_CAPTURE = 1
+_V4L2_FRMSIZE_TYPE_DISCRETE = 1
+_V4L2_FRMIVAL_TYPE_DISCRETE = 1
+_V4L2_ENUM_MAX = 256
+# 보고할 카메라 해상도 후보(우선순위 순) / fps 조회 불가 시 기본값
+_CAMERA_RESOLUTIONS = ((1920, 1080), (1280, 720))
+_CAMERA_DEFAULT_FPS = 30
+
+# 설비 정보 캐시 유지 시간(초): 프린터(시리얼 M115 왕복)는 짧게, 카메라는 길게
+PRINTER_INFO_TTL = 30.0
+CAMERA_INFO_TTL = 300.0
+# 만료된 값을 즉시 반환하는 최대 나이(TTL 배수): 초과 시(장시간 미조회 후) 이전 값 대신 동기 조회
+CACHE_STALE_MAX = 3
+
+# 프린터(시리얼)/카메라(ioctl·subprocess) 조회 병렬 실행 및 캐시 백그라운드 갱신용 공유 풀(I/O 대기 중 GIL 해제)
+_PROBE_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix='equipment-probe')
+
+
+class _StaleWhileRevalidate:
+    """TTL 캐시(stale-while-revalidate).
+
+    - 만료 전: 캐시된 값 즉시 반환
+    - 만료 후 TTL×CACHE_STALE_MAX 이내: 이전 값을 즉시 반환하고 _PROBE_POOL에서 1회 갱신
+    - 최초 조회(캐시 없음) 또는 TTL×CACHE_STALE_MAX 초과: 호출 스레드에서 동기 조회
+    - 값이 교체될 때마다 세대(generation)가 증가: 같은 세대의 값으로 만든 결과(직렬화 바이트 등)는 재사용 가능
+    """
+
+    def __init__(self, fn: Callable[[], Dict[str, Any]], ttl: float):
+        self._fn = fn
+        self._ttl = ttl
+        self._lock = threading.Lock()
+        self._load_lock = threading.Lock()
+        self._data: Optional[Dict[str, Any]] = None
+        self._gen = 0
+        self._ts = 0.0
+        self._refreshing = False
+        # (세대, 해당 세대 값의 JSON 바이트)
+        self._json: Tuple[int, bytes] = (0, b'')
+
+    def _usable(self) -> Optional[Tuple[Dict[str, Any], int]]:
+        """[self._lock 보유] 반환 가능한 (캐시 값, 세대)(없거나 최대 나이 초과 시 None)"""
+        if self._data is None or time.monotonic() - self._ts >= self._ttl * CACHE_STALE_MAX:
+            return None
+        return self._data, self._gen
+
+    def get(self) -> Dict[str, Any]:
+        return self.get_entry()[0]
+
+    def get_entry(self) -> Tuple[Dict[str, Any], int]:
+        """(값, 세대) 반환"""
+        with self._lock:
+            entry = self._usable()
+            if (entry is not None and not self._refreshing
+                    and time.monotonic() - self._ts >= self._ttl):
+                self._refreshing = True
+                _PROBE_POOL.submit(self._refresh)
+        if entry is not None:
+            return entry
+        # 캐시 없음/너무 오래됨: 동시 호출은 한 번만 조회
+        with self._load_lock:
+            with self._lock:
+                entry = self._usable()
+            if entry is not None:
+                return entry
+            return self._refresh()
+
+    def get_json(self) -> bytes:
+        """현재 값의 JSON 바이트(세대가 바뀐 경우에만 다시 직렬화)"""
+        data, gen = self.get_entry()
+        cached = self._json
+        if cached[0] != gen:
+            cached = (gen, json_bytes(data))
+            self._json = cached
+        return cached[1]
+
+    def _refresh(self) -> Tuple[Dict[str, Any], int]:
+        data = None
+        try:
+            data = self._fn()
+        finally:
+            with self._lock:
+                if data is not None:
+                    self._data = data
+                    self._gen += 1
+                    self._ts = time.monotonic()
+                self._refreshing = False
+                gen = self._gen
+        return data, gen
+
+
+# 설비 조회용 ConfigManager 공유 인스턴스(생성 시 YAML 로드 + 파일 감시 스레드 시작)
+_CONFIG_MANAGER: Optional['ConfigManager'] = None
+_CONFIG_LOCK = threading.Lock()
+
+
+def _config_manager() -> 'ConfigManager':
+    """ConfigManager를 최초 1회만 생성해 재사용(설정 파일 변경은 내장 파일 감시로 자동 반영)"""
+    global _CONFIG_MANAGER
+    with _CONFIG_LOCK:
+        if _CONFIG_MANAGER is None:
+            _CONFIG_MANAGER = ConfigManager()
+        return _CONFIG_MANAGER
+
+
 def get_equipment_info() -> Dict[str, Any]:
     """현재 연결된 설비의 정보를 조회하여 반환
     
+    프린터/카메라 정보는 항목별 캐시에서 반환(만료 시 백그라운드 갱신)
+    캐시가 비어 있는 최초 조회는 프린터/카메라를 동시에 조회(지연 = 둘 중 긴 쪽)
+    
     Returns:
         Dict[str, Any]: 설비 정보 딕셔너리
     """
+    fp = _PROBE_POOL.submit(_PRINTER_CACHE.get)
+    camera = _CAMERA_CACHE.get()
     equipment_info = {
         "equipment": {
-            "printer": get_printer_info(),
-            "camera": get_camera_info(),
+            "printer": fp.result(),
+            "camera": camera,
             "software": get_software_info()
         }
     }
@@ -39,6 +196,19 @@ def get_equipment_info() -> Dict[str, Any]:
     return equipment_info
 
 
+def get_equipment_info_json() -> bytes:
+    """get_equipment_info()와 같은 내용의 JSON 바이트
+
+    프린터/카메라는 캐시 세대별로 직렬화해 둔 바이트를 이어 붙이고,
+    매번 값이 바뀌는 소프트웨어 정보(uptime 등)만 새로 직렬화
+    """
+    fp = _PROBE_POOL.submit(_PRINTER_CACHE.get_json)
+    camera = _CAMERA_CACHE.get_json()
+    return b'{"equipment": {"printer": %s, "camera": %s, "software": %s}}' % (
+        fp.result(), camera, json_bytes(get_software_info())
+    )
+
+
 def get_printer_info() -> Dict[str, Any]:
     """프린터 정보 조회
     
@@ -61,7 +231,7 @@ def get_printer_info() -> Dict[str, Any]:
             return printer_info
             
         # 설정 파일에서 프린터 정보 읽기
-        config_manager = ConfigManager()
+        config_manager = _config_manager()
         printer_config = config_manager.get('printer', {})
         
         printer_info["serial_port"] = printer_config.get('port', '')
@@ -83,12 +253,23 @@ def get_printer_info() -> Dict[str, Any]:
                         # 연결 시도
                         try:
                             import serial
+                            # 포트를 지정하기 전에 DTR/RTS를 내려 두어 열 때 보드 리셋(부트로더 대기) 방지
                             pc.serial_conn = serial.Serial(
-                                port=printer_info["serial_port"],
                                 baudrate=printer_info["baud_rate"],
-                                timeout=0.5,
-                                write_timeout=1
+                                timeout=M115_LINE_TIMEOUT,
+                                write_timeout=1,
+                                rtscts=False,
+                                dsrdtr=False
                             )
+                            pc.serial_conn.dtr = False
+                            pc.serial_conn.rts = False
+                            pc.serial_conn.port = printer_info["serial_port"]
+                            pc.serial_conn.open()
+                            # FTDI 등 USB-시리얼 지연 타이머 최소화(ASYNC_LOW_LATENCY, 미지원 드라이버는 무시)
+                            try:
+                                pc.serial_conn.set_low_latency_mode(True)
+                            except (AttributeError, ValueError):
+                                pass
                         except Exception as e:
                             logging.getLogger('ble-gatt').warning(f"시리얼 연결 실패: {e}")
                             pc.serial_conn = None
@@ -96,98 +277,72 @@ def get_printer_info() -> Dict[str, Any]:
                     if pc.serial_conn and pc.serial_conn.is_open:
                         printer_info["status"] = True
                         
-                        # 프린터 정보 조회 시도
-                        try:
-                            # M115 명령으로 프린터 정보 조회
-                            pc.serial_conn.write(b"M115\n")
-                            pc.serial_conn.flush()
-                            
-                            # 응답 대기 및 여러 라인 읽기
-                            time.sleep(0.5)
-                            responses = []
-                            while pc.serial_conn.in_waiting > 0:
-                                response = pc.serial_conn.readline().decode('utf-8', 'ignore').strip()
-                                if response:
-                                    responses.append(response)
+                        # pyserial 버퍼/타임아웃 계층을 거치지 않고 fd에 직접 쓰고 poll로 읽음
+                        fd = pc.serial_conn.fileno()
+                        device_id = _usb_serial_identity(printer_info["serial_port"])
+                        cached = _load_m115_cache(device_id, printer_info["baud_rate"]) if device_id else None
+                        if cached is not None and _printer_responds(fd):
+                            # 같은 장치의 최근 M115 결과 재사용(응답 확인됨, 다중 라인 M115 왕복 생략)
+                            printer_info.update(cached)
+                        else:
+                            # 프린터 정보 조회 시도
+                            try:
+                                # M115 명령으로 프린터 정보 조회
+                                os.write(fd, b"M115\n")
+                                raw = _read_until_ok(fd, M115_DEADLINE)
+                                responses = [ln.strip() for ln in raw.decode('utf-8', 'ignore').splitlines() if ln.strip()]
                             
-                            # ===== M115 KV 파싱 (collection 유틸로 위임) =====
-                            from core.core_collection import DataCollectionModule
-                            kv = DataCollectionModule.extract_m115_kv_from_lines(responses)
-                            fw = kv.get("FIRMWARE_NAME")
-                            if fw:
-                                printer_info["firmware"] = fw
-                            model = kv.get("MACHINE_TYPE")
-                            if model:
-                                printer_info["model"] = model
-                            uuid_val = kv.get("UUID")
-                            if uuid_val:
-                                printer_info["uuid"] = uuid_val
-                            proto = kv.get("PROTOCOL_VERSION")
-                            if proto:
-                                printer_info["protocol_version"] = proto
-                            ec = kv.get("EXTRUDER_COUNT")
-                            if ec:
-                                try:
+                                # ===== M115 KV 파싱 (collection 유틸로 위임) =====
+                                from core.core_collection import DataCollectionModule
+                                kv = DataCollectionModule.extract_m115_kv_from_lines(responses)
+                                fw = kv.get("FIRMWARE_NAME")
+                                if fw:
+                                    printer_info["firmware"] = fw
+                                model = kv.get("MACHINE_TYPE")
+                                uuid_val = kv.get("UUID")
+                                if uuid_val:
+                                    printer_info["uuid"] = uuid_val
+                                proto = kv.get("PROTOCOL_VERSION")
+                                if proto:
+                                    printer_info["protocol_version"] = proto
+                                ec = kv.get("EXTRUDER_COUNT")
+                                if ec and ec.isdigit():
                                     printer_info["extruder_count"] = int(ec)
-                                except ValueError:
-                                    pass
-                            src = kv.get("SOURCE_CODE_URL")
-                            if src:
-                                printer_info["source_code_url"] = src
+                                src = kv.get("SOURCE_CODE_URL")
+                                if src:
+                                    printer_info["source_code_url"] = src
 
-                            # ===== UUID를 설정 파일에 저장(변경 시 갱신) =====
-                            try:
-                                cm = ConfigManager()
-                                cm.update_equipment_uuid(printer_info.get('uuid'))
-                            except Exception as e:
-                                logging.getLogger('ble-gatt').warning(f"설비 UUID 저장 실패: {e}")
-                            
-                            # MACHINE_TYPE이 없으면 FIRMWARE_NAME에서 모델명 추출 시도
-                            if not printer_info.get("model") or printer_info["model"] == "Unknown":
-                                if printer_info.get("firmware"):
-                                    if "Ender-3 V3 SE" in printer_info["firmware"]:
-                                        printer_info["model"] = "Creality Ender-3 V3 SE"
-                                    elif "Ender-3 V2 Neo" in printer_info["firmware"]:
-                                        printer_info["model"] = "Creality Ender-3 V2 Neo"
-                                    elif "Ender-3" in printer_info["firmware"]:
-                                        printer_info["model"] = "Creality Ender-3"
-                                    elif "Ender-5" in printer_info["firmware"]:
-                                        printer_info["model"] = "Creality Ender-5"
-                                    elif "Prusa" in printer_info["firmware"]:
-                                        printer_info["model"] = "Prusa i3"
-                                    elif "Ultimaker" in printer_info["firmware"]:
-                                        printer_info["model"] = "Ultimaker"
-                                    else:
-                                        printer_info["model"] = "Unknown 3D Printer"
-                            
-                            # 기존 펌웨어 타입 확인 (Klipper, RepRapFirmware 등)
-                            for response in responses:
-                                if "Klipper" in response:
-                                    printer_info["firmware"] = "Klipper"
-                                    if not printer_info.get("model") or printer_info["model"] == "Unknown 3D Printer":
-                                        printer_info["model"] = "Klipper-based Printer"
-                                    break
-                                elif "RepRapFirmware" in response:
-                                    printer_info["firmware"] = "RepRapFirmware"
-                                    if not printer_info.get("model") or printer_info["model"] == "Unknown 3D Printer":
-                                        printer_info["model"] = "RepRap-based Printer"
-                                    break
-                                elif "Marlin" in response:
-                                    printer_info["firmware"] = "Marlin"
-                                    if not printer_info.get("model") or printer_info["model"] == "Unknown 3D Printer":
-                                        printer_info["model"] = "RepRap-based Printer"
-                                    break
+                                # ===== UUID를 설정 파일에 저장(변경 시 갱신) =====
+                                try:
+                                    config_manager.update_equipment_uuid(printer_info.get('uuid'))
+                                except Exception as e:
+                                    logging.getLogger('ble-gatt').warning(f"설비 UUID 저장 실패: {e}")
                             
-                            # 설정 파일에서 모델 정보 확인
-                            if printer_info["model"] == "Unknown 3D Printer":
-                                model_from_config = printer_config.get('model', '')
-                                if model_from_config:
-                                    printer_info["model"] = model_from_config
+                                # 펌웨어 계열(Klipper, RepRapFirmware, Marlin): 전체 응답 1회 검색
+                                family_m = _FW_FAMILY_RE.search('\n'.join(responses))
+                                if family_m:
+                                    printer_info["firmware"] = family_m.group(0)
+
+                                # 모델명 우선순위: MACHINE_TYPE > FIRMWARE_NAME 내 모델명 > 펌웨어 계열 > 설정 파일
+                                model_m = _FW_MODEL_RE.search(fw) if fw else None
+                                printer_info["model"] = (
+                                    model
+                                    or (model_m and _FW_MODEL_NAMES[model_m.group(0)])
+                                    or (family_m and _FW_FAMILY_MODELS[family_m.group(0)])
+                                    or printer_config.get('model')
+                                    or "Unknown 3D Printer"
+                                )
+
+                                # 펌웨어 식별에 성공한 결과만 다음 조회용으로 저장(고유 식별자 있는 장치만)
+                                if device_id and printer_info["firmware"] != "Unknown":
+                                    _store_m115_cache(device_id, printer_info["baud_rate"], {
+                                        k: v for k, v in printer_info.items() if k not in ("status", "message")
+                                    })
                                     
-                        except Exception as e:
-                            logging.getLogger('ble-gatt').warning(f"프린터 정보 조회 실패: {e}")
-                            printer_info["model"] = "Unknown 3D Printer"
-                            printer_info["firmware"] = "Unknown"
+                            except Exception as e:
+                                logging.getLogger('ble-gatt').warning(f"프린터 정보 조회 실패: {e}")
+                                printer_info["model"] = "Unknown 3D Printer"
+                                printer_info["firmware"] = "Unknown"
                         
                         # 연결 해제
                         pc.serial_conn.close()
@@ -214,6 +369,175 @@ def get_printer_info() -> Dict[str, Any]:
     return printer_info
 
 
+def _usb_serial_identity(port: str) -> Optional[str]:
+    """포트에 연결된 USB 장치의 고유 식별자(sysfs idVendor:idProduct:serial)
+
+    시리얼 번호가 없는 장치(CH340 등)나 USB가 아닌 포트는 장치 구분이 불가하므로 None
+    """
+    tty = os.path.basename(os.path.realpath(port))
+    dev = os.path.realpath(os.path.join('/sys/class/tty', tty, 'device'))
+    # tty 인터페이스 디렉터리에서 상위로 올라가며 serial 속성이 있는 USB 장치 디렉터리 탐색
+    while dev.startswith('/sys/devices/'):
+        try:
+            with open(os.path.join(dev, 'serial')) as f:
+                serial_no = f.read().strip()
+            with open(os.path.join(dev, 'idVendor')) as f:
+                vendor = f.read().strip()
+            with open(os.path.join(dev, 'idProduct')) as f:
+                product = f.read().strip()
+        except FileNotFoundError:
+            dev = os.path.dirname(dev)
+            continue
+        except OSError:
+            return None
+        return f"{vendor}:{product}:{serial_no}" if serial_no else None
+    return None
+
+
+def _read_m115_cache_file() -> Dict[str, Any]:
+    try:
+        with open(M115_CACHE_PATH, 'rb') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def _load_m115_cache(device_id: str, baudrate: int) -> Optional[Dict[str, Any]]:
+    """장치/보레이트가 같고 M115_CACHE_TTL 이내인 저장된 M115 결과 반환(없으면 None)"""
+    entry = _read_m115_cache_file().get(device_id)
+    if not isinstance(entry, dict) or not isinstance(entry.get('result'), dict):
+        return None
+    if entry.get('baudrate') != baudrate or time.time() - entry.get('ts', 0) >= M115_CACHE_TTL:
+        return None
+    return entry['result']
+
+
+def _store_m115_cache(device_id: str, baudrate: int, result: Dict[str, Any]) -> None:
+    """장치별 M115 결과 저장(임시 파일 작성 후 교체, 실패는 경고만)"""
+    cache = _read_m115_cache_file()
+    cache[device_id] = {'baudrate': baudrate, 'ts': int(time.time()), 'result': result}
+    tmp = M115_CACHE_PATH + '.tmp'
+    try:
+        with open(tmp, 'w') as f:
+            json.dump(cache, f)
+        os.replace(tmp, M115_CACHE_PATH)
+    except OSError as e:
+        logging.getLogger('ble-gatt').warning(f"M115 캐시 저장 실패: {e}")
+
+
+def _printer_responds(fd: int) -> bool:
+    """단일 라인 응답 명령(M105)을 보내 M115_DEADLINE 내 'ok' 수신 여부 확인"""
+    os.write(fd, _PRINTER_ALIVE_CMD)
+    return _M115_OK_RE.search(_read_until_ok(fd, M115_DEADLINE)) is not None
+
+
+def _read_until_ok(fd: int, timeout: float) -> bytes:
+    """fd에서 'ok' 종료 라인 수신 또는 timeout(초) 경과까지 읽은 원시 바이트 반환"""
+    poller = select.poll()
+    poller.register(fd, select.POLLIN)
+    poll_ms = int(M115_LINE_TIMEOUT * 1000)
+    deadline = time.monotonic() + timeout
+    buf = bytearray()
+    while time.monotonic() < deadline:
+        if not poller.poll(poll_ms):
+            continue
+        try:
+            chunk = os.read(fd, 4096)
+        except BlockingIOError:
+            continue
+        if not chunk:
+            break
+        buf += chunk
+        if _M115_OK_RE.search(buf):
+            break
+    return bytes(buf)
+
+
+def _v4l2_enum(fd: int, request: int, st: struct.Struct, *head: int) -> Iterator[Tuple[int, ...]]:
+    """V4L2 열거 ioctl을 index 0부터 호출해 항목 반환(EINVAL에서 종료)
+
+    head: index 다음에 채울 입력 필드(type / pixel_format / width, height 등)
+    """
+    for index in range(_V4L2_ENUM_MAX):
+        buf = bytearray(st.size)
+        struct.pack_into('%dI' % (1 + len(head)), buf, 0, index, *head)
+        try:
+            fcntl.ioctl(fd, request, buf, True)
+        except OSError as e:
+            if e.errno == errno.EINVAL:
+                return
+            raise
+        yield st.unpack(buf)
+
+
+def _v4l2_max_fps(fd: int, pixfmt: int, width: int, height: int) -> int:
+    """포맷/해상도별 최대 fps(최소 프레임 간격 den/num). 조회 불가 시 0"""
+    best = 0.0
+    for iv in _v4l2_enum(fd, _VIDIOC_ENUM_FRAMEINTERVALS, _V4L2_FRMIVALENUM, pixfmt, width, height):
+        num, den = iv[5], iv[6]
+        if num:
+            best = max(best, den / num)
+        if iv[4] != _V4L2_FRMIVAL_TYPE_DISCRETE:
+            # stepwise/continuous: 첫 항목의 min이 최소 간격
+            break
+    return int(round(best))
+
+
+def _probe_v4l2_ioctl(device: str) -> Optional[Tuple[str, int]]:
+    """V4L2 ioctl로 지원 해상도/fps 조회(프로세스 생성 없음)
+
+    Returns:
+        Optional[Tuple[str, int]]: (resolution, fps), 캡처 포맷이 없으면 None
+    """
+    fd = os.open(device, os.O_RDWR | os.O_NONBLOCK)
+    try:
+        formats = [fmt[4] for fmt in _v4l2_enum(fd, _VIDIOC_ENUM_FMT, _V4L2_FMTDESC,
+                                                _V4L2_BUF_TYPE_VIDEO_CAPTURE)]
+        if not formats:
+            return None
+        # 같은 해상도를 여러 포맷(YUYV/MJPG 등)이 지원할 수 있으므로 포맷을 모두 보관
+        discrete: Dict[Tuple[int, int], List[int]] = {}
+        ranges: List[Tuple[int, int, int, int, int]] = []
+        for pixfmt in formats:
+            for fs in _v4l2_enum(fd, _VIDIOC_ENUM_FRAMESIZES, _V4L2_FRMSIZEENUM, pixfmt):
+                if fs[2] == _V4L2_FRMSIZE_TYPE_DISCRETE:
+                    discrete.setdefault((fs[3], fs[4]), []).append(pixfmt)
+                else:
+                    # stepwise/continuous: (pixfmt, min_w, max_w, min_h, max_h)
+                    ranges.append((pixfmt, fs[3], fs[4], fs[6], fs[7]))
+        for width, height in _CAMERA_RESOLUTIONS:
+            pixfmts = discrete.get((width, height), []) + [
+                r[0] for r in ranges if r[1] <= width <= r[2] and r[3] <= height <= r[4]]
+            if pixfmts:
+                # 해상도를 지원하는 포맷 중 최대 fps(비압축 YUYV보다 MJPG가 높은 경우가 많음)
+                fps = max(_v4l2_max_fps(fd, pixfmt, width, height) for pixfmt in pixfmts)
+                return f"{width}x{height}", fps or _CAMERA_DEFAULT_FPS
+        return "Unknown", 0
+    finally:
+        os.close(fd)
+
+
+def _probe_v4l2_ctl(device: str) -> Tuple[str, int]:
+    """v4l2-ctl 출력으로 지원 해상도 확인(ioctl 조회 불가 시 대체 경로)"""
+    import subprocess  # 대체 경로에서만 사용하므로 사용 시점에 import
+    try:
+        result = subprocess.run(
+            ["v4l2-ctl", "--list-formats-ext", "-d", device],
+            capture_output=True, text=True, timeout=5
+        )
+        if result.returncode == 0:
+            # 해상도 정보 파싱
+            output = result.stdout
+            if "1920x1080" in output:
+                return "1920x1080", 30
+            elif "1280x720" in output:
+                return "1280x720", 30
+    except Exception:
+        pass
+    return "Unknown", 0
+
+
 def get_camera_info() -> Dict[str, Any]:
     """카메라 정보 조회
     
@@ -234,30 +558,14 @@ def get_camera_info() -> Dict[str, Any]:
             camera_info["status"] = True
             camera_info["model"] = "Raspberry Pi Camera Module"
             
-            # 카메라 해상도 확인
+            # 카메라 해상도 확인: V4L2 ioctl 직접 조회, 불가 시 v4l2-ctl로 대체
             try:
-                result = subprocess.run(
-                    ["v4l2-ctl", "--list-formats-ext", "-d", "/dev/video0"],
-                    capture_output=True, text=True, timeout=5
-                )
-                if result.returncode == 0:
-                    # 해상도 정보 파싱
-                    output = result.stdout
-                    if "1920x1080" in output:
-                        camera_info["resolution"] = "1920x1080"
-                        camera_info["fps"] = 30
-                    elif "1280x720" in output:
-                        camera_info["resolution"] = "1280x720"
-                        camera_info["fps"] = 30
-                    else:
-                        camera_info["resolution"] = "Unknown"
-                        camera_info["fps"] = 0
-                else:
-                    camera_info["resolution"] = "Unknown"
-                    camera_info["fps"] = 0
-            except Exception:
-                camera_info["resolution"] = "Unknown"
-                camera_info["fps"] = 0
+                probed = _probe_v4l2_ioctl("/dev/video0")
+            except OSError:
+                probed = None
+            if probed is None:
+                probed = _probe_v4l2_ctl("/dev/video0")
+            camera_info["resolution"], camera_info["fps"] = probed
             
             # 스트림 URL 설정
             camera_info["stream_url"] = "http://localhost:8080/stream"
@@ -274,82 +582,117 @@ def get_camera_info() -> Dict[str, Any]:
     return camera_info
 
 
-def get_software_info() -> Dict[str, Any]:
-    """소프트웨어 정보 조회
-    
+def _load_static_software_info() -> Dict[str, Any]:
+    """소프트웨어/시스템 정보 중 실행 중 변하지 않는 항목 조회(모듈 로드 시 1회)
+
     Returns:
-        Dict[str, Any]: 소프트웨어 정보
+        Dict[str, Any]: {"firmware_version", "api_version", "uuid", "system": {...}}
     """
-    software_info = {
+    static_info: Dict[str, Any] = {
         "firmware_version": "1.0.0",
         "api_version": "1.0.0",
-        "last_update": datetime.now().isoformat() + "Z",
-        "update_available": False,
-        "uuid": None
+        "uuid": None,
+        "system": {
+            "platform": "Raspberry Pi",
+            "python_version": "%d.%d.%d" % sys.version_info[:3],
+        },
     }
-    
+    system_info = static_info["system"]
+
+    # 버전 정보 파일 확인
     try:
-        # 버전 정보 파일 확인
         version_file = "version.json"
         if os.path.exists(version_file):
             with open(version_file, 'r') as f:
                 version_data = json.load(f)
-                software_info["firmware_version"] = version_data.get("version", "1.0.0")
-                software_info["api_version"] = version_data.get("api_version", "1.0.0")
-        
-        # 시스템 정보 추가
-        software_info["system"] = {
-            "platform": "Raspberry Pi",
-            "python_version": f"{psutil.sys.version_info.major}.{psutil.sys.version_info.minor}.{psutil.sys.version_info.micro}",
-            "uptime": int(time.time() - psutil.boot_time())
-        }
-        
-        # 라즈베리파이 모델 정보 조회
-        try:
-            with open('/proc/cpuinfo', 'r') as f:
-                cpuinfo = f.read()
-                if 'Raspberry Pi' in cpuinfo:
-                    for line in cpuinfo.split('\n'):
-                        if 'Model' in line:
-                            model = line.split(':')[1].strip()
-                            software_info["system"]["hardware_model"] = model
-                            break
-        except Exception:
-            software_info["system"]["hardware_model"] = "Unknown"
-        
-        # OS 정보 조회
-        try:
-            import platform
-            software_info["system"]["os"] = f"{platform.system()} {platform.release()}"
-        except Exception:
-            software_info["system"]["os"] = "Unknown"
-        
-        # 라즈베리파이 고유 시리얼을 uuid로 설정
-        try:
-            serial_paths = [
-                "/proc/device-tree/serial-number",
-                "/sys/firmware/devicetree/base/serial-number"
-            ]
-            for spath in serial_paths:
-                if os.path.exists(spath):
-                    with open(spath, "rb") as f:
-                        raw = f.read()
-                        value = raw.decode("utf-8", "ignore").replace("\x00", "").strip()
-                        if value:
-                            software_info["uuid"] = value
-                            break
-        except Exception as e:
-            logging.getLogger('ble-gatt').warning(f"RPi serial-number 읽기 실패: {e}")
-        
-        # Factor Client 버전 정보
-        try:
-            from core import __version__
-            software_info["firmware_version"] = __version__
-        except ImportError:
-            pass
-        
+                static_info["firmware_version"] = version_data.get("version", "1.0.0")
+                static_info["api_version"] = version_data.get("api_version", "1.0.0")
+    except Exception:
+        logging.getLogger('ble-gatt').exception("version.json 읽기 실패")
+
+    # 라즈베리파이 모델 정보 조회(bytes에서 Model 줄 1회 검색)
+    try:
+        with open('/proc/cpuinfo', 'rb') as f:
+            cpuinfo = f.read()
+        if b'Raspberry Pi' in cpuinfo:
+            m = _CPUINFO_MODEL_RE.search(cpuinfo)
+            if m:
+                system_info["hardware_model"] = m.group(1).decode('utf-8', 'ignore').strip()
+    except Exception:
+        system_info["hardware_model"] = "Unknown"
+
+    # OS 정보 조회(uname 1회)
+    try:
+        uname = platform.uname()
+        system_info["os"] = f"{uname.system} {uname.release}"
+    except Exception:
+        system_info["os"] = "Unknown"
+
+    # 라즈베리파이 고유 시리얼을 uuid로 설정
+    try:
+        serial_paths = [
+            "/proc/device-tree/serial-number",
+            "/sys/firmware/devicetree/base/serial-number"
+        ]
+        for spath in serial_paths:
+            if os.path.exists(spath):
+                with open(spath, "rb") as f:
+                    raw = f.read()
+                    value = raw.decode("utf-8", "ignore").replace("\x00", "").strip()
+                    if value:
+                        static_info["uuid"] = value
+                        break
     except Exception as e:
-        logging.getLogger('ble-gatt').exception("소프트웨어 정보 조회 중 오류")
-        software_info["error"] = str(e)
+        logging.getLogger('ble-gatt').warning(f"RPi serial-number 읽기 실패: {e}")
+
+    # Factor Client 버전 정보
+    try:
+        from core import __version__
+        static_info["firmware_version"] = __version__
+    except ImportError:
+        pass
+
+    return static_info
+
+
+def get_software_info() -> Dict[str, Any]:
+    """소프트웨어 정보 조회
     
+    고정 항목은 모듈 로드 시 조회한 값을 사용하고 uptime/last_update만 매번 계산
+    
+    Returns:
+        Dict[str, Any]: 소프트웨어 정보
+    """
+    software_info = {
+        "firmware_version": _STATIC_SOFTWARE["firmware_version"],
+        "api_version": _STATIC_SOFTWARE["api_version"],
+        "last_update": datetime.now().isoformat() + "Z",
+        "update_available": False,
+        "uuid": _STATIC_SOFTWARE["uuid"]
+    }
+    software_info["system"] = {
+        **_STATIC_SOFTWARE["system"],
+        "uptime": int(time.time() - _boot_time())
+    }
     return software_info
+
+
+_CPUINFO_MODEL_RE = re.compile(rb'^Model\s*:\s*(.+)$', re.MULTILINE)
+_STATIC_SOFTWARE = _load_static_software_info()
+
+
+@lru_cache(maxsize=None)
+def _boot_time() -> float:
+    """부팅 시각(UNIX 초): 최초 소프트웨어 정보 조회 시 psutil을 import해 1회만 계산"""
+    try:
+        import psutil
+        return psutil.boot_time()
+    except Exception:
+        logging.getLogger('ble-gatt').exception("부팅 시각 조회 실패")
+        return time.time()
+
+
+# 항목별 캐시(시리얼 타임아웃 등 프린터 조회 지연이 카메라 캐시에 영향 주지 않도록 분리)
+# 소프트웨어 정보는 고정 항목이 모듈 로드 시 계산되므로 캐시 없이 매번 생성(uptime 최신 유지)
+_PRINTER_CACHE = _StaleWhileRevalidate(get_printer_info, PRINTER_INFO_TTL)
+_CAMERA_CACHE = _StaleWhileRevalidate(get_camera_info, CAMERA_INFO_TTL)
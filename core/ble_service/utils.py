@@ -3,6 +3,20 @@ import json
 import logging
 from typing import Any, Dict
 
+# orjson 사용 가능 시 C 구현 직렬화/파싱으로 bytes 직접 처리(없으면 표준 json)
+try:
+    import orjson  # type: ignore
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
+
+# cbor2 사용 가능 시 format=cbor 요청에 CBOR 응답(requirements.txt 의존성, 미설치 시 JSON + format 표시)
+try:
+    import cbor2  # type: ignore
+    _HAS_CBOR = True
+except ImportError:
+    _HAS_CBOR = False
+
 
 def json_bytes(obj: Dict[str, Any]) -> bytes:
     """주어진 딕셔너리를 UTF-8 JSON 바이트로 직렬화.
@@ -12,19 +26,57 @@ def json_bytes(obj: Dict[str, Any]) -> bytes:
     - 실패: 예외를 로깅하고 빈 JSON(b'{}') 반환
     """
     try:
+        if _HAS_ORJSON:
+            try:
+                # OPT_NON_STR_KEYS: 정수 등 비문자열 키도 표준 json과 같이 문자열 키로 직렬화
+                return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+            except TypeError:
+                # orjson 미지원 타입은 표준 json으로 재시도
+                pass
         return json.dumps(obj, ensure_ascii=False).encode('utf-8', errors='ignore')
     except Exception:
         logging.getLogger('ble-gatt').exception("json dumps 실패")
         return b'{}'
 
 
+def payload_bytes(obj: Dict[str, Any], fmt: str = 'json') -> bytes:
+    """응답 딕셔너리를 요청된 형식으로 직렬화.
+
+    - fmt='cbor' 이고 cbor2 사용 가능: CBOR 바이트(정수/반복 키가 많은 스캔 결과에서 JSON 대비 축소)
+    - fmt='cbor' 이지만 CBOR 불가(cbor2 미설치, 직렬화 실패): "format": "json" 표시를 넣은 JSON
+      (요청과 다른 형식임을 클라이언트가 알 수 있도록)
+    - 그 외: json_bytes 결과
+    """
+    if fmt == 'cbor':
+        if _HAS_CBOR:
+            try:
+                return cbor2.dumps(obj)
+            except Exception:
+                logging.getLogger('ble-gatt').exception("cbor dumps 실패, JSON으로 대체")
+        else:
+            logging.getLogger('ble-gatt').warning("cbor2 미설치: format=cbor 요청에 JSON으로 응답")
+        return json_bytes({**obj, "format": "json"})
+    return json_bytes(obj)
+
+
+def json_loads(raw: bytes) -> Any:
+    """UTF-8 JSON 바이트를 파싱(orjson 우선).
+
+    - 입력: bytes(디코딩 없이 그대로 전달)
+    - 실패: ValueError 계열 예외 전파(호출 측에서 invalid_json 처리)
+    """
+    if _HAS_ORJSON:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
 def now_ts() -> int:
-    """현재 UNIX 타임스탬프(초)를 정수로 반환."""
-    return int(time.time())
+    """현재 UNIX 타임스탬프(초)를 정수로 반환(time_ns 정수 나눗셈, float 변환 없음)."""
+    return time.time_ns() // 1_000_000_000
 
 
 def now_ms() -> int:
-    """현재 UNIX 타임스탬프(밀리초)를 정수로 반환."""
-    return int(time.time() * 1000)
+    """현재 UNIX 타임스탬프(밀리초)를 정수로 반환(time_ns 정수 나눗셈, float 변환 없음)."""
+    return time.time_ns() // 1_000_000
 
 
@@ -1,11 +1,260 @@
+import array
+import fcntl
+import os
+import re
+import shutil
+import socket
+import struct
 import subprocess
+import threading
 import time
 import logging
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
 
+# pyroute2 사용 가능 시 nl80211 netlink로 직접 스캔(선택 의존성, 프로세스 생성/텍스트 파싱 없음)
+try:
+    from pyroute2 import IW  # type: ignore
+    _HAS_PYROUTE2 = True
+except ImportError:
+    _HAS_PYROUTE2 = False
 
-def scan_wifi_networks() -> List[Dict[str, Any]]:
-    """주변 Wi‑Fi 네트워크를 스캔하여 요약 리스트 반환.
+_LOG = logging.getLogger('ble-gatt')
+
+# 스캔 결과 캐시(TTL 동안 재스캔 없이 반환, 클라이언트 재시도 시 드라이버 부하 방지)
+# TTL(초)은 FACTOR_WIFI_SCAN_TTL 환경 변수로 조정 가능
+try:
+    _SCAN_TTL = float(os.getenv('FACTOR_WIFI_SCAN_TTL', '20'))
+except ValueError:
+    _SCAN_TTL = 20.0
+_SCAN_CACHE: Dict[str, Any] = {"ts": 0.0, "nets": []}
+_SCAN_LOCK = threading.Lock()
+
+# 네트워크 상태 캐시(상태 특성 폴링 시 ioctl·/proc 조회 반복 방지)
+_NET_STATUS_TTL = 1.0
+_NET_STATUS_CACHE: Dict[str, Any] = {"ts": 0.0, "status": None}
+_NET_STATUS_LOCK = threading.Lock()
+
+# iwlist 경로(모듈 로드 시 1회 조회). install.sh에서 cap_net_admin 부여 시 sudo 없이 실행
+_IWLIST = shutil.which('iwlist') or shutil.which('iwlist', path='/usr/sbin:/sbin') or 'iwlist'
+# 파일 capability(security.capability xattr, struct vfs_cap_data) 판별용
+_CAP_NET_ADMIN = 12
+_VFS_CAP_FLAGS_EFFECTIVE = 0x000001
+
+# nmcli -t 출력의 필드 토큰(이스케이프 시퀀스 '\\x' 단위로 소비, 줄 끝에 ':'를 덧붙여 매칭)
+_NMCLI_FIELD_RE = re.compile(r'((?:\\.|[^:\\])*):')
+_NMCLI_UNESCAPE_RE = re.compile(r'\\(.)')
+# iwlist 파싱: 보안 유형 우선순위(셀 내 더 강한 유형으로만 갱신)
+_SECURITY_RANK = {'Open': 0, 'Protected': 1, 'WEP': 2, 'WPA': 3, 'WPA2': 4}
+_IE_WPA2_PREFIXES = (b'IE: IEEE 802.11i', b'IE: WPA2', b'IE: RSN')
+_SIGNAL_PREFIXES = (b'Quality', b'Signal level')
+
+# 스캔 대상 인터페이스 / 802.11 capability의 Privacy 비트
+_WIFI_IFNAME = 'wlan0'
+_WLAN_CAPABILITY_PRIVACY = 0x0010
+
+# 네트워크 상태 조회 ioctl(linux/wireless.h, linux/sockios.h) / 라우트 플래그(linux/route.h)
+_SIOCGIWESSID = 0x8B1B
+_SIOCGIFADDR = 0x8915
+_IW_ESSID_MAX_SIZE = 32
+# struct iwreq: ifr_name[16] + iw_point{pointer, length, flags}
+_IWREQ_POINT_FMT = '16sPHH'
+_IWREQ_SIZE = 32
+_RTF_UP = 0x0001
+_RTF_GATEWAY = 0x0002
+
+# wpa_supplicant 제어 소켓 디렉터리(ctrl_interface) / 응답 수신 버퍼 크기
+_WPA_CTRL_DIR = '/var/run/wpa_supplicant'
+_WPA_REPLY_MAX = 65536
+# 연결 대기 중 즉시 실패로 판단할 이벤트(인증/연결 거부, 비밀번호 오류로 인한 임시 비활성화)
+# CTRL-EVENT-DISCONNECTED는 select_network 시 기존 연결 해제로도 발생하므로 제외
+_WPA_CONNECTED_EVENT = 'CTRL-EVENT-CONNECTED'
+_WPA_FAILURE_EVENTS = ('CTRL-EVENT-ASSOC-REJECT', 'CTRL-EVENT-AUTH-REJECT', 'CTRL-EVENT-SSID-TEMP-DISABLED')
+# SCAN 트리거 후 결과 이벤트 대기 상한(초)
+_WPA_SCAN_TIMEOUT = 10.0
+
+
+def scan_wifi_networks(force: bool = False) -> List[Dict[str, Any]]:
+    """주변 Wi‑Fi 네트워크 목록 반환(캐시 우선).
+
+    - 마지막 스캔 후 _SCAN_TTL 초 이내면 캐시된 결과 반환
+    - force=True 이면 캐시를 무시하고 재스캔
+    - 빈 결과(스캔 실패 포함)는 캐시하지 않음
+    """
+    with _SCAN_LOCK:
+        if (not force and _SCAN_CACHE["nets"]
+                and time.monotonic() - _SCAN_CACHE["ts"] < _SCAN_TTL):
+            return list(_SCAN_CACHE["nets"])
+        nets = _scan_wifi_networks_nl80211()
+        if nets is None:
+            nets = _scan_wifi_networks_wpa()
+        if nets is None:
+            nets = _scan_wifi_networks_nmcli(rescan=force)
+        if nets is None:
+            nets = _scan_wifi_networks_iwlist()
+        if nets:
+            _SCAN_CACHE["ts"] = time.monotonic()
+            _SCAN_CACHE["nets"] = nets
+        return list(nets)
+
+
+def _scan_wifi_networks_nl80211() -> Optional[List[Dict[str, Any]]]:
+    """pyroute2(nl80211)로 스캔을 트리거하고 커널 BSS 목록을 직접 조회(CAP_NET_ADMIN 필요).
+
+    - 커널 스캔 캐시만 덤프하지 않음: 연결된 상태에서는 미사용 항목이 만료되어 현재 AP만 남음
+      (호출은 scan_wifi_networks 캐시 미스 시에만 발생)
+    - pyroute2 미설치/권한 부족/결과 없음 시 None 반환(wpa_supplicant/nmcli/iwlist 폴백)
+    """
+    if not _HAS_PYROUTE2:
+        return None
+    try:
+        ifindex = socket.if_nametoindex(_WIFI_IFNAME)
+        iw = IW()
+        try:
+            results = iw.scan(ifindex)
+        finally:
+            iw.close()
+    except Exception:
+        _LOG.info("nl80211 스캔 불가, wpa_supplicant로 대체")
+        return None
+
+    networks: List[Dict[str, Any]] = []
+    for r in results:
+        bss = r.get_attr('NL80211_ATTR_BSS')
+        if bss is None:
+            continue
+        ies = bss.get_attr('NL80211_BSS_INFORMATION_ELEMENTS') or {}
+        ssid = ies.get('SSID')
+        if isinstance(ssid, bytes):
+            ssid = ssid.decode('utf-8', 'replace')
+        if not ssid:
+            continue
+        # SIGNAL_MBM: mBm 정수 또는 pyroute2 디코딩 결과 {'SIGNAL_STRENGTH': {'VALUE': dBm}}
+        sig = bss.get_attr('NL80211_BSS_SIGNAL_MBM')
+        if isinstance(sig, dict):
+            rssi = int((sig.get('SIGNAL_STRENGTH') or {}).get('VALUE', -100))
+        elif isinstance(sig, int):
+            rssi = sig // 100
+        else:
+            rssi = -100
+        cap = bss.get_attr('NL80211_BSS_CAPABILITY')
+        if 'RSN' in ies:
+            security = 'WPA2'
+        elif isinstance(cap, int) and cap & _WLAN_CAPABILITY_PRIVACY:
+            security = 'Protected'
+        else:
+            security = 'Open'
+        networks.append({'ssid': ssid, 'rssi': rssi, 'security': security})
+    return networks or None
+
+
+def _scan_wifi_networks_wpa() -> Optional[List[Dict[str, Any]]]:
+    """wpa_supplicant 제어 소켓 SCAN_RESULTS(탭 구분 표)로 BSS 목록 조회.
+
+    - 항상 SCAN 트리거 후 CTRL-EVENT-SCAN-RESULTS 이벤트 수신 시 조회
+      (연결된 상태의 wpa_supplicant는 스스로 재스캔하지 않아 만료 후 현재 AP만 남으므로
+      기존 결과만 읽지 않음, 호출은 scan_wifi_networks 캐시 미스 시에만 발생)
+    - 같은 SSID(여러 BSSID)는 신호가 가장 강한 항목 1개만 유지
+    - 제어 소켓 사용 불가/결과 없음 시 None 반환(nmcli/iwlist 폴백)
+    """
+    try:
+        monitor = _WpaCtl()
+        try:
+            if not monitor.attach():
+                return None
+            # FAIL-BUSY(이미 스캔 중)여도 진행 중인 스캔의 결과 이벤트를 기다림
+            _WPA.request('SCAN')
+            if monitor.wait_event(('CTRL-EVENT-SCAN-RESULTS',), _WPA_SCAN_TIMEOUT) is None:
+                return None
+        finally:
+            monitor.close()
+        body = _WPA.request('SCAN_RESULTS')
+    except OSError:
+        _LOG.info("wpa_supplicant 스캔 불가, nmcli로 대체")
+        return None
+
+    best: Dict[str, Dict[str, Any]] = {}
+    for line in body.splitlines()[1:]:  # 첫 줄은 헤더
+        fields = line.split('\t', 4)
+        if len(fields) < 5 or not fields[4]:
+            continue
+        ssid = fields[4]
+        if '\\' in ssid:
+            # printf 이스케이프(\xNN, \\, \")된 원시 바이트 복원 후 UTF-8 디코드
+            ssid = (ssid.encode('latin-1', 'replace').decode('unicode_escape')
+                    .encode('latin-1', 'replace').decode('utf-8', 'replace'))
+        try:
+            rssi = int(fields[2])
+        except ValueError:
+            rssi = -100
+        flags = fields[3]
+        # WPA3-SAE는 '[WPA2-SAE-CCMP]'로 표기되므로 WPA2보다 먼저 판별
+        # (PSK 병행 전환 모드 '[WPA2-PSK+SAE-CCMP]'는 호환성을 위해 WPA2로 분류)
+        if 'SAE' in flags and 'PSK' not in flags:
+            security = 'WPA3'
+        elif 'WPA2' in flags or 'RSN' in flags:
+            security = 'WPA2'
+        elif 'WPA' in flags:
+            security = 'WPA'
+        elif 'WEP' in flags:
+            security = 'WEP'
+        else:
+            security = 'Open'
+        prev = best.get(ssid)
+        if prev is None or rssi > prev['rssi']:
+            best[ssid] = {'ssid': ssid, 'rssi': rssi, 'security': security}
+    return list(best.values()) or None
+
+
+def _scan_wifi_networks_nmcli(rescan: bool = False) -> Optional[List[Dict[str, Any]]]:
+    """NetworkManager가 보유한 스캔 목록을 nmcli terse 출력으로 조회.
+
+    - rescan=False: 드라이버 재스캔 없이 NM 내부 캐시 목록 사용
+    - SIGNAL(0~100)은 rssi(dBm 근사)로 변환: signal/2 - 100
+    - nmcli 미설치/NetworkManager 미실행 시 None 반환(iwlist 폴백)
+    """
+    try:
+        r = subprocess.run(
+            ['nmcli', '-t', '-f', 'SSID,SIGNAL,SECURITY', 'device', 'wifi', 'list',
+             '--rescan', 'yes' if rescan else 'no'],
+            capture_output=True, text=True, timeout=15
+        )
+    except Exception:
+        _LOG.info("nmcli 스캔 불가, iwlist로 대체")
+        return None
+    if r.returncode != 0:
+        return None
+
+    networks: List[Dict[str, Any]] = []
+    for line in (r.stdout or '').splitlines():
+        fields = [_NMCLI_UNESCAPE_RE.sub(r'\1', f) for f in _NMCLI_FIELD_RE.findall(line + ':')]
+        if len(fields) < 3:
+            continue
+        ssid = fields[0]
+        if not ssid:
+            continue
+        try:
+            rssi = int(fields[1]) // 2 - 100
+        except ValueError:
+            rssi = -100
+        sec = fields[2]
+        if 'WPA2' in sec:
+            security = 'WPA2'
+        elif 'WPA3' in sec:
+            security = 'WPA3'
+        elif 'WPA' in sec:
+            security = 'WPA'
+        elif 'WEP' in sec:
+            security = 'WEP'
+        elif sec in ('', '--'):
+            security = 'Open'
+        else:
+            security = 'Protected'
+        networks.append({'ssid': ssid, 'rssi': rssi, 'security': security})
+    return networks
+
+
+def _scan_wifi_networks_iwlist() -> List[Dict[str, Any]]:
+    """iwlist로 주변 Wi‑Fi 네트워크를 스캔하여 요약 리스트 반환.
 
     - 출력 항목 예: [{"ssid": str, "rssi": int, "security": str}, ...]
     - RSSI, 보안 유형을 가능한 한 파싱하여 채움(실패 시 기본값)
@@ -13,122 +262,181 @@ def scan_wifi_networks() -> List[Dict[str, Any]]:
     """
     networks: List[Dict[str, Any]] = []
     try:
-        result = subprocess.run(['sudo', 'iwlist', 'wlan0', 'scan'], capture_output=True, text=True, timeout=15)
+        # 출력 전체를 str로 디코드하지 않고 bytes로 파싱(SSID 값만 디코드)
+        # 스캔 트리거 권한이 없으면 iwlist는 오류 없이 이전 결과만 출력하므로 출력이 아닌 권한으로 sudo 여부 결정
+        cmd = [_IWLIST, 'wlan0', 'scan'] if _IWLIST_PRIVILEGED else ['sudo', _IWLIST, 'wlan0', 'scan']
+        result = subprocess.run(cmd, capture_output=True, timeout=15)
         if result.returncode != 0:
             return networks
-        current: Dict[str, Any] = {}
-        for raw in (result.stdout or '').split('\n'):
-            line = (raw or '').strip()
-            if not line:
-                continue
-            if line.startswith('Cell '):
-                if current.get('ssid'):
-                    networks.append(current)
-                current = {}
-                continue
-            if 'ESSID:' in line:
-                try:
-                    ssid = line.split('ESSID:', 1)[1].strip().strip('"')
-                    current['ssid'] = ssid
-                except Exception:
-                    logging.getLogger('ble-gatt').exception("iwlist 파싱(ESSID) 실패")
+        return _parse_iwlist_scan(result.stdout or b'')
+    except Exception:
+        _LOG.exception("Wi-Fi 스캔 실패(iwlist)")
+        return networks
+
+
+def _iwlist_privileged() -> bool:
+    """iwlist를 sudo 없이 실행해도 스캔을 트리거할 수 있는지(root 또는 cap_net_admin+ep 파일 capability)"""
+    if os.geteuid() == 0:
+        return True
+    try:
+        raw = os.getxattr(os.path.realpath(_IWLIST), 'security.capability')
+    except OSError:
+        return False
+    if len(raw) < 8:
+        return False
+    magic_etc, permitted = struct.unpack_from('<II', raw)
+    return bool(magic_etc & _VFS_CAP_FLAGS_EFFECTIVE and permitted & (1 << _CAP_NET_ADMIN))
+
+
+# iwlist sudo 필요 여부(모듈 로드 시 1회 판별, 권한 변경은 서비스 재시작 시 반영)
+_IWLIST_PRIVILEGED = _iwlist_privileged()
+
+
+def _parse_iwlist_scan(out: bytes) -> List[Dict[str, Any]]:
+    """iwlist scan 출력(bytes)을 줄 단위 1회 순회(상태 머신)로 파싱.
+
+    - 'Cell ' 줄에서 새 셀 시작, ESSID가 비어 있지 않으면 결과에 추가
+    - 보안 유형은 줄마다 즉시 갱신(더 강한 유형만 반영: WPA2 > WPA > WEP > Protected > Open)
+    """
+    networks: List[Dict[str, Any]] = []
+    net: Optional[Dict[str, Any]] = None
+    rank = 0
+    for line in out.splitlines():
+        line = line.strip()
+        # 빈도순 분기(셀당 여러 개인 IE 줄 → 셀당 1회인 줄), 그 외 줄은 접두사 비교만으로 건너뜀
+        if line.startswith(b'IE: '):
+            if line.startswith(_IE_WPA2_PREFIXES):
+                sec = 'WPA2'
+            elif line.startswith(b'IE: WPA'):
+                sec = 'WPA'
+            elif b'WEP' in line:
+                sec = 'WEP'
+            else:
                 continue
-            if 'Signal level=' in line:
+        elif line.startswith(_SIGNAL_PREFIXES):
+            if net is not None:
+                tail = line.partition(b'Signal level=')[2]
                 try:
-                    import re as _re
-                    m = _re.search(r'Signal level=\s*(-?\d+)', line)
-                    if m:
-                        current['rssi'] = int(m.group(1))
-                except Exception:
-                    logging.getLogger('ble-gatt').exception("iwlist 파싱(RSSI) 실패")
-                continue
-            if 'Encryption key:' in line:
-                enc_on = 'on' in line.lower()
-                current.setdefault('_enc', enc_on)
-                continue
-            if ('WPA2' in line) or ('IEEE 802.11i' in line) or ('RSN' in line):
-                current['security'] = 'WPA2'
-                continue
-            if 'WPA' in line and 'WPA2' not in line:
-                current.setdefault('security', 'WPA')
+                    net['rssi'] = int(tail.split(None, 1)[0].split(b'/', 1)[0])
+                except (IndexError, ValueError):
+                    pass
+            continue
+        elif line.startswith(b'ESSID:'):
+            # ESSID:"name" → 따옴표 내부
+            ssid = line[7:-1].decode('utf-8', 'replace')
+            if net is not None and ssid:
+                net['ssid'] = ssid
+                networks.append(net)
+            continue
+        elif line.startswith(b'Cell '):
+            net = {'ssid': '', 'rssi': -100, 'security': 'Open'}
+            rank = 0
+            continue
+        elif line == b'Encryption key:on':
+            sec = 'Protected'
+        else:
+            continue
+        if net is not None and _SECURITY_RANK[sec] > rank:
+            rank = _SECURITY_RANK[sec]
+            net['security'] = sec
+    return networks
+
+
+def _ioctl_essid(ifname: str) -> str:
+    """SIOCGIWESSID로 현재 연결된 SSID 조회(미연결 시 '', 무선 확장 미지원 시 OSError)"""
+    buf = array.array('B', bytes(_IW_ESSID_MAX_SIZE + 1))
+    req = struct.pack(_IWREQ_POINT_FMT, ifname.encode(), buf.buffer_info()[0], len(buf), 0)
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+        res = fcntl.ioctl(s.fileno(), _SIOCGIWESSID, req.ljust(_IWREQ_SIZE, b'\0'))
+    length = struct.unpack_from(_IWREQ_POINT_FMT, res)[2]
+    return buf.tobytes()[:length].rstrip(b'\0').decode('utf-8', 'replace')
+
+
+def _ioctl_ipv4(ifname: str) -> str:
+    """SIOCGIFADDR로 인터페이스 IPv4 주소 조회(주소/인터페이스 없음 시 '')"""
+    try:
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+            res = fcntl.ioctl(s.fileno(), _SIOCGIFADDR, struct.pack('256s', ifname.encode()[:15]))
+    except OSError:
+        return ''
+    # struct ifreq: ifr_name[16] + sockaddr_in(family 2, port 2, addr 4)
+    return socket.inet_ntoa(res[20:24])
+
+
+def _default_route() -> Tuple[str, str]:
+    """/proc/net/route에서 기본 경로의 (인터페이스, 게이트웨이) 조회(없으면 ('', '')).
+
+    eth0/wlan0이 함께 올라온 경우 등 기본 경로가 여럿이면 커널과 같이 Metric이 가장 작은 활성 경로 선택
+    """
+    best: Optional[Tuple[int, str, str]] = None
+    with open('/proc/net/route') as f:
+        next(f, None)  # 헤더
+        for line in f:
+            fields = line.split()
+            if len(fields) < 7 or fields[1] != '00000000':
                 continue
-            if 'WEP' in line:
-                current.setdefault('security', 'WEP')
+            flags = int(fields[3], 16)
+            if flags & (_RTF_UP | _RTF_GATEWAY) != (_RTF_UP | _RTF_GATEWAY):
                 continue
-        if current.get('ssid'):
-            networks.append(current)
-        for n in networks:
-            if 'security' not in n:
-                n['security'] = 'Protected' if n.get('_enc') else 'Open'
-            if 'rssi' not in n:
-                n['rssi'] = -100
-            n.pop('_enc', None)
-        return networks
-    except Exception:
-        logging.getLogger('ble-gatt').exception("Wi-Fi 스캔 실패(iwlist)")
-        return networks
+            metric = int(fields[6])
+            if best is None or metric < best[0]:
+                best = (metric, fields[0], fields[2])
+    if best is None:
+        return '', ''
+    # Gateway는 네트워크 바이트 순서 값을 호스트(리틀 엔디언) 16진수로 표기
+    return best[1], socket.inet_ntoa(struct.pack('<L', int(best[2], 16)))
 
 
-def get_network_status() -> Dict[str, Any]:
-    """현재 네트워크 상태 요약 반환.
+def get_network_status(force: bool = False) -> Dict[str, Any]:
+    """현재 네트워크 상태 요약 반환(캐시 우선).
 
     - wifi: {interface, connected, ssid, ip, gateway}
     - ethernet: {interface, connected, ip, gateway}
     - 일부 항목은 사용 환경에 따라 비어 있을 수 있음
+    - 마지막 조회 후 _NET_STATUS_TTL 초 이내면 캐시된 결과의 복사본 반환
+    - force=True 이면 캐시를 무시하고 재조회
     """
+    with _NET_STATUS_LOCK:
+        status = _NET_STATUS_CACHE["status"]
+        if (force or status is None
+                or time.monotonic() - _NET_STATUS_CACHE["ts"] >= _NET_STATUS_TTL):
+            status = _read_network_status()
+            _NET_STATUS_CACHE["ts"] = time.monotonic()
+            _NET_STATUS_CACHE["status"] = status
+        # 호출 측에서 수정해도 캐시가 변하지 않도록 항목별 복사
+        return {k: dict(v) for k, v in status.items()}
+
+
+def _read_network_status() -> Dict[str, Any]:
+    """프로세스 생성 없이 ioctl(SSID/IP)과 /proc/net/route(게이트웨이)로 네트워크 상태 조회"""
     status: Dict[str, Any] = {
         'wifi': {'interface': 'wlan0', 'connected': False, 'ssid': '', 'ip': '', 'gateway': ''},
         'ethernet': {'interface': 'eth0', 'connected': False, 'ip': '', 'gateway': ''},
     }
     try:
-        r = subprocess.run(['iwgetid', '-r'], capture_output=True, text=True, timeout=3)
-        if r.returncode == 0:
-            ssid = (r.stdout or '').strip()
-            if ssid:
-                status['wifi']['ssid'] = ssid
-                status['wifi']['connected'] = True
-    except Exception:
-        logging.getLogger('ble-gatt').exception("iwgetid 실행 실패")
-    try:
-        import psutil  # type: ignore
-        addrs = psutil.net_if_addrs()
-        def _first_ipv4_addr(ifname: str) -> str:
-            for snic in addrs.get(ifname, []) or []:
-                import socket as _sock
-                if getattr(snic, 'family', None) == getattr(_sock, 'AF_INET', None):
-                    return snic.address or ''
-            return ''
-        status['wifi']['ip'] = _first_ipv4_addr('wlan0')
-        status['ethernet']['ip'] = _first_ipv4_addr('eth0')
-        if status['ethernet']['ip']:
-            status['ethernet']['connected'] = True
+        try:
+            ssid = _ioctl_essid('wlan0')
+        except OSError:
+            # 무선 확장(WEXT) 미지원 드라이버: iwgetid로 대체
+            r = subprocess.run(['iwgetid', '-r'], capture_output=True, text=True, timeout=3)
+            ssid = (r.stdout or '').strip() if r.returncode == 0 else ''
+        if ssid:
+            status['wifi']['ssid'] = ssid
+            status['wifi']['connected'] = True
     except Exception:
-        logging.getLogger('ble-gatt').exception("IP 주소 조회(psutil) 실패")
+        _LOG.exception("SSID 조회 실패")
+    status['wifi']['ip'] = _ioctl_ipv4('wlan0')
+    status['ethernet']['ip'] = _ioctl_ipv4('eth0')
+    if status['ethernet']['ip']:
+        status['ethernet']['connected'] = True
     try:
-        r = subprocess.run(['ip', 'route', 'show', 'default'], capture_output=True, text=True, timeout=3)
-        line = (r.stdout or '').splitlines()[0] if (r.returncode == 0 and (r.stdout or '').strip()) else ''
-        if line:
-            parts = line.split()
-            gw = ''
-            dev = ''
-            if 'via' in parts:
-                try:
-                    gw = parts[parts.index('via') + 1]
-                except Exception:
-                    logging.getLogger('ble-gatt').exception("기본 게이트웨이 파싱(via) 실패")
-                    gw = ''
-            if 'dev' in parts:
-                try:
-                    dev = parts[parts.index('dev') + 1]
-                except Exception:
-                    logging.getLogger('ble-gatt').exception("기본 게이트웨이 파싱(dev) 실패")
-                    dev = ''
-            if dev == 'wlan0':
-                status['wifi']['gateway'] = gw
-            elif dev == 'eth0':
-                status['ethernet']['gateway'] = gw
+        dev, gw = _default_route()
+        if dev == 'wlan0':
+            status['wifi']['gateway'] = gw
+        elif dev == 'eth0':
+            status['ethernet']['gateway'] = gw
     except Exception:
-        logging.getLogger('ble-gatt').exception("기본 게이트웨이 조회(ip route) 실패")
+        _LOG.exception("기본 게이트웨이 조회(/proc/net/route) 실패")
     return status
 
 
@@ -139,10 +447,113 @@ def _nm_is_running() -> bool:
                            capture_output=True, text=True, timeout=3)
         return r.returncode == 0 and (r.stdout or '').strip().lower() == 'running'
     except Exception:
-        logging.getLogger('ble-gatt').exception("NetworkManager 상태 확인 실패")
+        _LOG.exception("NetworkManager 상태 확인 실패")
         return False
 
 
+class _WpaCtl:
+    """wpa_supplicant 제어 소켓 클라이언트(wpa_cli와 같은 요청/응답 프로토콜, 프로세스 생성 없음).
+
+    - 요청: 명령 문자열 1개 = 데이터그램 1개, 응답도 데이터그램 1개
+    - 응답 주소는 커널 자동 바인드(abstract) 주소 사용(임시 파일 없음)
+    - 소켓은 첫 요청 시 열고 재사용, wpa_supplicant 재시작 등으로 끊기면 1회 재연결
+    - 소켓 접근 불가(권한/미실행) 시 OSError 전파 → 호출 측에서 wpa_cli로 대체
+    """
+
+    def __init__(self, ifname: str = _WIFI_IFNAME):
+        self._path = os.path.join(_WPA_CTRL_DIR, ifname)
+        self._sock: Optional[socket.socket] = None
+        self._lock = threading.Lock()
+        # ATTACH 성공 여부(닫기 전 DETACH 전송 대상)
+        self._attached = False
+
+    def _open(self) -> socket.socket:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        try:
+            sock.bind('')
+            sock.connect(self._path)
+        except OSError:
+            sock.close()
+            raise
+        self._sock = sock
+        return sock
+
+    def request(self, cmd: str, timeout: float = 5.0) -> str:
+        with self._lock:
+            for retry in (False, True):
+                sock = self._sock or self._open()
+                try:
+                    sock.settimeout(timeout)
+                    sock.send(cmd.encode('utf-8'))
+                    while True:
+                        reply = sock.recv(_WPA_REPLY_MAX)
+                        # '<' 로 시작하는 데이터그램은 요청 응답이 아닌 비동기 이벤트
+                        if not reply.startswith(b'<'):
+                            return reply.decode('utf-8', 'replace')
+                except socket.timeout:
+                    # 늦게 도착한 응답이 다음 요청의 응답으로 읽히지 않도록 소켓 폐기
+                    self._close_locked()
+                    raise
+                except (ConnectionRefusedError, FileNotFoundError, BrokenPipeError):
+                    self._close_locked()
+                    if retry:
+                        raise
+
+    def ping(self) -> bool:
+        """제어 소켓 사용 가능 여부(PING → PONG)"""
+        try:
+            return self.request('PING', timeout=1.0).startswith('PONG')
+        except OSError:
+            return False
+
+    def attach(self) -> bool:
+        """이벤트 수신 등록(ATTACH). 이후 이벤트는 wait_event로 수신, close()에서 DETACH"""
+        self._attached = self.request('ATTACH').startswith('OK')
+        return self._attached
+
+    def wait_event(self, prefixes: Tuple[str, ...], timeout: float) -> Optional[str]:
+        """prefixes 중 하나로 시작하는 이벤트를 timeout(초)까지 대기('<N>' 우선순위 제거 후 반환, 시간 초과 시 None)"""
+        sock = self._sock
+        if sock is None:
+            return None
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            sock.settimeout(remaining)
+            try:
+                frame = sock.recv(_WPA_REPLY_MAX)
+            except socket.timeout:
+                return None
+            if not frame.startswith(b'<'):
+                continue
+            event = frame.partition(b'>')[2].decode('utf-8', 'replace')
+            if event.startswith(prefixes):
+                return event
+
+    def _close_locked(self) -> None:
+        if self._sock is not None:
+            if self._attached:
+                # 모니터 등록 해제(DETACH): 소켓만 닫으면 wpa_supplicant가 전송 실패까지
+                # 이벤트를 계속 보내므로 명시적으로 해제. 응답은 기다리지 않음(best effort)
+                try:
+                    self._sock.send(b'DETACH')
+                except OSError:
+                    pass
+            self._sock.close()
+            self._sock = None
+        self._attached = False
+
+    def close(self) -> None:
+        with self._lock:
+            self._close_locked()
+
+
+# 요청/응답용 공유 제어 소켓 세션(연결·스캔 명령이 재사용, 이벤트 수신은 ATTACH한 별도 인스턴스 사용)
+_WPA = _WpaCtl()
+
+
 def wpa_connect_immediate(data: Dict[str, Any], persist: bool = False) -> Dict[str, Any]:
     """wpa_cli를 사용해 설정 파일 저장 없이 즉시 Wi‑Fi 연결 시도.
 
@@ -160,32 +571,43 @@ def wpa_connect_immediate(data: Dict[str, Any], persist: bool = False) -> Dict[s
     if not ssid:
         return {"ok": False, "message": "ssid required"}
 
-    def run(args: List[str], timeout: int = 5) -> subprocess.CompletedProcess:
+    # 공유 제어 소켓으로 전체 명령 순서를 처리(명령마다 wpa_cli fork/exec 생략)
+    ctl: Optional[_WpaCtl] = _WPA
+    if not _WPA.ping():
+        _LOG.info("wpa_supplicant 제어 소켓 사용 불가, wpa_cli로 대체")
+        ctl = None
+    monitor: Optional[_WpaCtl] = None
+
+    def run(args: List[str], timeout: int = 5) -> str:
+        """wpa_cli 명령(소문자 인자 목록) 실행 후 응답 문자열 반환(실행 실패 시 'FAIL ...')"""
+        if ctl is not None:
+            return ctl.request(' '.join([args[0].upper()] + args[1:]), timeout).strip()
         # 권한 문제 방지를 위해 sudo로 실행
-        cmd = ['sudo'] + args
-        return subprocess.run(cmd, capture_output=True, text=True, timeout=timeout)
+        r = subprocess.run(['sudo', 'wpa_cli', '-i', 'wlan0'] + args,
+                           capture_output=True, text=True, timeout=timeout)
+        if r.returncode != 0:
+            return f"FAIL {(r.stderr or r.stdout or '').strip()}"
+        return (r.stdout or '').strip()
 
     try:
-        lg = logging.getLogger('ble-gatt')
-        lg.info("wpa_connect_immediate start ssid=%s security=%s hidden=%s priority=%s persist=%s",
-                ssid, security, hidden, priority, persist)
+        _LOG.info("wpa_connect_immediate start ssid=%s security=%s hidden=%s priority=%s persist=%s",
+                  ssid, security, hidden, priority, persist)
 
-        lg.info("wpa_cli add_network ...")
-        r = run(['wpa_cli', '-i', 'wlan0', 'add_network'])
-        lg.info("add_network rc=%s out=%s err=%s", r.returncode, (r.stdout or '').strip(), (r.stderr or '').strip())
-        if r.returncode != 0 or not (r.stdout or '').strip().isdigit():
-            return {"ok": False, "message": f"add_network failed: {r.stdout or r.stderr}", "ssid": ssid}
-        nid = (r.stdout or '').strip()
+        _LOG.info("wpa_cli add_network ...")
+        nid = run(['add_network'])
+        _LOG.info("add_network out=%s", nid)
+        if not nid.isdigit():
+            return {"ok": False, "message": f"add_network failed: {nid}", "ssid": ssid}
 
         def set_net(key: str, value: str):
             masked = value
             if key in ('psk', 'sae_password'):
                 masked = '"***"'
-            lg.info("set_network[%s]=%s", key, masked)
-            rr = run(['wpa_cli', '-i', 'wlan0', 'set_network', nid, key, value])
-            lg.info("set_network rc=%s out=%s err=%s", rr.returncode, (rr.stdout or '').strip(), (rr.stderr or '').strip())
-            if rr.returncode != 0 or 'FAIL' in (rr.stdout or ''):
-                raise RuntimeError(f"set_network {key} failed: {rr.stdout or rr.stderr}")
+            _LOG.info("set_network[%s]=%s", key, masked)
+            out = run(['set_network', nid, key, value])
+            _LOG.info("set_network out=%s", out)
+            if 'FAIL' in out:
+                raise RuntimeError(f"set_network {key} failed: {out}")
 
         set_net('ssid', f'"{ssid}"')
         if hidden:
@@ -208,25 +630,39 @@ def wpa_connect_immediate(data: Dict[str, Any], persist: bool = False) -> Dict[s
             set_net('key_mgmt', 'WPA-PSK')
             set_net('psk', '"%s"' % password.replace('"', '\\"'))
 
+        # 연결 이벤트를 놓치지 않도록 연결 명령 전에 이벤트 수신 등록
+        if ctl is not None:
+            monitor = _WpaCtl()
+            try:
+                attached = monitor.attach()
+            except OSError:
+                attached = False
+            if not attached:
+                monitor.close()
+                monitor = None
+
         for cmd in (['enable_network', nid], ['select_network', nid], ['reassociate']):
-            lg.info("wpa_cli %s ...", ' '.join(cmd))
-            rr = run(['wpa_cli', '-i', 'wlan0'] + cmd)
-            lg.info("cmd rc=%s out=%s err=%s", rr.returncode, (rr.stdout or '').strip(), (rr.stderr or '').strip())
-            if rr.returncode != 0 or 'FAIL' in (rr.stdout or ''):
-                return {"ok": False, "message": f"{' '.join(cmd)} failed: {rr.stdout or rr.stderr}", "ssid": ssid}
+            _LOG.info("wpa_cli %s ...", ' '.join(cmd))
+            out = run(cmd)
+            _LOG.info("cmd out=%s", out)
+            if 'FAIL' in out:
+                return {"ok": False, "message": f"{' '.join(cmd)} failed: {out}", "ssid": ssid}
 
         if persist:
-            run(['wpa_cli', '-i', 'wlan0', 'save_config'])
+            run(['save_config'])
 
-        lg.info("wait_wifi_connected start timeout=25s")
-        res = wait_wifi_connected(timeout_sec=25)
-        lg.info("wait_wifi_connected result: %s", res)
+        _LOG.info("wait_wifi_connected start timeout=25s")
+        res = wait_wifi_connected(timeout_sec=25, monitor=monitor)
+        _LOG.info("wait_wifi_connected result: %s", res)
         if res.get('ok'):
             return {"ok": True, "message": "connected", "ssid": ssid}
         return {"ok": False, "message": "apply_done_but_not_connected", "ssid": ssid, "error": res.get('error')}
     except Exception:
-        logging.getLogger('ble-gatt').exception("wpa_cli 즉시 연결 실패")
+        _LOG.exception("wpa_cli 즉시 연결 실패")
         return {"ok": False, "message": "exception", "ssid": ssid}
+    finally:
+        if monitor is not None:
+            monitor.close()
 
 
 
@@ -237,7 +673,6 @@ def nm_connect_immediate(data: Dict[str, Any]) -> Dict[str, Any]:
     - 성공: {ok: True, message: 'connected', ssid}
     - 실패: {ok: False, message: str, ssid}
     """
-    lg = logging.getLogger('ble-gatt')
     ssid = str(data.get('ssid', '')).strip()
     password = str(data.get('password') or '')
     hidden = bool(data.get('hidden', False))
@@ -245,38 +680,45 @@ def nm_connect_immediate(data: Dict[str, Any]) -> Dict[str, Any]:
         return {"ok": False, "message": "ssid required"}
 
     try:
-        lg.info("nm_connect_immediate start ssid=%s hidden=%s", ssid, hidden)
+        _LOG.info("nm_connect_immediate start ssid=%s hidden=%s", ssid, hidden)
         # 권한 문제 방지를 위해 sudo로 실행 (install.sh에서 sudoers 규칙 추가 필요)
         cmd = ['sudo', 'nmcli', '-w', '20', 'dev', 'wifi', 'connect', ssid, 'ifname', 'wlan0']
         if password:
             cmd += ['password', password]
         if hidden:
             cmd += ['hidden', 'yes']
-        lg.info("nmcli exec: %s", ' '.join(cmd))
+        _LOG.info("nmcli exec: %s", ' '.join(cmd))
         r = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-        lg.info("nmcli rc=%s out=%s err=%s", r.returncode, (r.stdout or '').strip(), (r.stderr or '').strip())
+        _LOG.info("nmcli rc=%s out=%s err=%s", r.returncode, (r.stdout or '').strip(), (r.stderr or '').strip())
         if r.returncode != 0:
             return {"ok": False, "message": f"nmcli failed: {r.stdout or r.stderr}", "ssid": ssid}
-        lg.info("wait_wifi_connected start timeout=25s")
+        _LOG.info("wait_wifi_connected start timeout=25s")
         res = wait_wifi_connected(timeout_sec=25)
-        lg.info("wait_wifi_connected result: %s", res)
+        _LOG.info("wait_wifi_connected result: %s", res)
         if res.get('ok'):
             return {"ok": True, "message": "connected", "ssid": ssid}
         return {"ok": False, "message": "apply_done_but_not_connected", "ssid": ssid, "error": res.get('error')}
     except Exception:
-        lg.exception("nmcli 즉시 연결 실패")
+        _LOG.exception("nmcli 즉시 연결 실패")
         return {"ok": False, "message": "exception", "ssid": ssid}
 
 
 
 # 와이파이 연결을 시도하고 지연시간내에 연결되면 연결 확인을 알려줌줌
-def wait_wifi_connected(timeout_sec: int = 25) -> Dict[str, Any]:
+def wait_wifi_connected(timeout_sec: int = 25, monitor: Optional[_WpaCtl] = None) -> Dict[str, Any]:
     """지정 시간 동안 Wi‑Fi 연결 완료 대기.
 
-    - 입력: timeout_sec(초)
+    - 입력: timeout_sec(초), monitor(ATTACH된 제어 소켓, 있으면 폴링 없이 연결 이벤트 대기)
     - 성공: {ok: True, status: get_network_status() 결과}
     - 실패: {ok: False, error: str}
     """
+    if monitor is not None:
+        event = monitor.wait_event((_WPA_CONNECTED_EVENT,) + _WPA_FAILURE_EVENTS, timeout_sec)
+        if event is None:
+            return {'ok': False, 'error': 'timeout'}
+        if not event.startswith(_WPA_CONNECTED_EVENT):
+            return {'ok': False, 'error': event}
+        return {'ok': True, 'status': get_network_status(force=True)}
     t0 = time.time()
     last_err = ''
     while time.time() - t0 < timeout_sec:
@@ -284,12 +726,12 @@ def wait_wifi_connected(timeout_sec: int = 25) -> Dict[str, Any]:
             r = subprocess.run(['iwgetid', '-r'], capture_output=True, text=True, timeout=3)
             ssid = (r.stdout or '').strip() if r.returncode == 0 else ''
             if ssid:
-                st = get_network_status()
+                st = get_network_status(force=True)
                 st['wifi']['ssid'] = ssid
                 st['wifi']['connected'] = True
                 return {'ok': True, 'status': st}
         except Exception as e:
-            logging.getLogger('ble-gatt').exception("즉시 연결 확인 실패(iwgetid)")
+            _LOG.exception("즉시 연결 확인 실패(iwgetid)")
             last_err = str(e)
         time.sleep(1.0)
-    return {'ok': False, 'error': last_err or 'timeout'}
\ No newline at end of file
+    return {'ok': False, 'error': last_err or 'timeout'}
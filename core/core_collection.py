@@ -19,6 +19,10 @@ class DataCollectionModule:
       - 코어: `FactorClient` 폴링 워커, `PrinterCommunicator` 수신 처리
     """
 
+    # M115 KEY:VALUE 파싱 패턴(클래스 로드 시 1회 컴파일, 정적 파싱 유틸에서 공유)
+    _M115_KV_RE = re.compile(r'([A-Z_]+):\s*(.*?)(?=\s+[A-Z_]+:|$)')
+    _M115_KEY_RE = re.compile(r'[A-Z_]+:')
+
     def __init__(self, pc: "PrinterCommunicator"):
         self.pc = pc
         # 정규식/상수 사전 컴파일
@@ -265,7 +269,7 @@ class DataCollectionModule:
         예: "FIRMWARE_NAME:Marlin 2.1.2 MACHINE_TYPE:Ender UUID:..."
         """
         try:
-            pattern = re.compile(r'([A-Z_]+):\s*(.*?)(?=\s+[A-Z_]+:|$)')
+            pattern = DataCollectionModule._M115_KV_RE
             return {m.group(1): m.group(2).strip() for m in pattern.finditer((line or '').strip())}
         except Exception:
             return {}
@@ -276,11 +280,12 @@ class DataCollectionModule:
         if not lines:
             return {}
         try:
+            key_re = DataCollectionModule._M115_KEY_RE
             for ln in lines:
                 if not ln:
                     continue
                 # KEY 토큰이 2개 이상 포함된 라인 우선 선택
-                if len(re.findall(r'[A-Z_]+:', ln)) >= 2:
+                if len(key_re.findall(ln)) >= 2:
                     return DataCollectionModule.parse_m115_kv_line(ln)
         except Exception:
             pass
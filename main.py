@@ -21,7 +21,7 @@ sys.path.insert(0, str(project_root))
 
 from core import ConfigManager, FactorClient, setup_logger
 from core.bluetooth_manager import BluetoothManager
-from core.ble_gatt_server import start_ble_gatt_server
+from core.ble_gatt_server import start_ble_gatt_server, stop_ble_gatt_server
 from web import create_app, socketio
 
 
@@ -238,6 +238,8 @@ class FactorClientFirmware:
             # 블루투스 관리자 정리
             if self.bluetooth_manager:
                 self.bluetooth_manager.stop_bluetooth()
+            # BLE GATT 서버 종료(광고/앱 등록 해제)
+            stop_ble_gatt_server()
             
             # 설정 관리자 정리
             if self.config_manager:
@@ -379,6 +379,13 @@ ControllerMode = le
 
 [Policy]
 AutoEnable=true
+
+# LE 연결 간격(1.25ms 단위): 커널 기본 24~40(30~50ms) → 8~9(10~11.25ms)
+# bluetoothd(root)가 시작 시 커널 기본값으로 적용(BlueZ 5.50+, 커널 5.8+).
+# 실제 간격은 central이 결정하므로 central이 기본값을 따르는 경우에만 효과가 있음
+[LE]
+MinConnectionInterval=8
+MaxConnectionInterval=9
 EOF
 
     # 블루투스 네트워크 설정
@@ -486,6 +493,14 @@ Defaults!$IWLIST_PATH !requiretty
 EOF
         chmod 440 /etc/sudoers.d/factor-iwlist
         log_info "sudoers에 iwlist 허용 규칙 추가"
+        # sudo 없이 스캔할 수 있도록 cap_net_admin 부여(실패 시 sudo 경로 사용)
+        if command -v setcap >/dev/null 2>&1; then
+            if setcap cap_net_admin+ep "$(readlink -f "$IWLIST_PATH")"; then
+                log_info "iwlist에 cap_net_admin 부여"
+            else
+                log_warning "iwlist cap_net_admin 부여 실패 (sudo로 스캔)"
+            fi
+        fi
     else
         log_warning "iwlist 바이너리를 찾을 수 없습니다. 무선 스캔 응답이 실패할 수 있습니다."
     fi